@@ -0,0 +1,110 @@
+from importlib import import_module
+
+from .core import (
+    DEFAULT_BRANCH,
+    Account,
+    CheckingAccount,
+    Client,
+    Deposit,
+    Fee,
+    History,
+    HistorySnapshot,
+    Individual,
+    PrefixView,
+    Transaction,
+    Withdrawal,
+    listener_errors,
+    notify_listeners,
+    transaction_listeners,
+)
+
+SUBMODULES = (
+    "aggregates",
+    "anomaly",
+    "batch",
+    "branches",
+    "cache",
+    "end_of_day",
+    "events",
+    "export",
+    "idempotency",
+    "importer",
+    "limits",
+    "listing",
+    "pipeline",
+    "reconciliation",
+    "retention",
+    "search",
+    "sequences",
+    "shared_balances",
+    "simulation",
+    "snapshot",
+    "startup",
+    "statements",
+    "storage",
+    "validation",
+)
+
+LAZY_ATTRIBUTES = {
+    "AccountCache": "cache",
+    "AnomalyDetector": "anomaly",
+    "AtomicBatch": "batch",
+    "Bank": "branches",
+    "BankAggregates": "aggregates",
+    "Branch": "branches",
+    "ClientIndex": "search",
+    "ColumnarReader": "export",
+    "CommandPipeline": "pipeline",
+    "EndOfDayPipeline": "end_of_day",
+    "EventBus": "events",
+    "Reconciliation": "reconciliation",
+    "RetentionPolicy": "retention",
+    "SQLiteRepository": "storage",
+    "SequenceAllocator": "sequences",
+    "SharedBalances": "shared_balances",
+    "Simulation": "simulation",
+    "Snapshot": "snapshot",
+    "StatementJob": "statements",
+    "cpf_error": "validation",
+    "export_columnar": "export",
+    "export_csv": "export",
+    "import_csv": "importer",
+    "read_columnar": "export",
+    "validate_cpfs": "validation",
+}
+
+__all__ = [
+    "DEFAULT_BRANCH",
+    "Account",
+    "CheckingAccount",
+    "Client",
+    "Deposit",
+    "Fee",
+    "History",
+    "HistorySnapshot",
+    "Individual",
+    "PrefixView",
+    "Transaction",
+    "Withdrawal",
+    "listener_errors",
+    "notify_listeners",
+    "transaction_listeners",
+    *LAZY_ATTRIBUTES,
+]
+
+
+def __getattr__(name):
+    if name in SUBMODULES:
+        return import_module(f".{name}", __name__)
+
+    module = LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *SUBMODULES, *LAZY_ATTRIBUTES})
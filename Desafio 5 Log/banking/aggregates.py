@@ -0,0 +1,185 @@
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from heapq import heappush, heapreplace
+from random import randrange
+
+from . import core
+from .core import CheckingAccount, Deposit, Fee, Individual, Withdrawal
+
+DEBITS = {Withdrawal.__name__, Fee.__name__}
+
+
+def day_key(day):
+    if isinstance(day, (date, datetime)):
+        return day.strftime("%d-%m-%Y")
+    return day
+
+
+class Totals:
+    __slots__ = ("deposits", "withdrawals", "count")
+
+    def __init__(self):
+        self.deposits = 0.0
+        self.withdrawals = 0.0
+        self.count = 0
+
+    def add(self, kind, amount):
+        if kind in DEBITS:
+            self.withdrawals += amount
+        else:
+            self.deposits += amount
+        self.count += 1
+
+    @property
+    def net(self):
+        return self.deposits - self.withdrawals
+
+    def as_dict(self):
+        return {
+            "deposits": self.deposits,
+            "withdrawals": self.withdrawals,
+            "net": self.net,
+            "transactions": self.count,
+        }
+
+
+class TopK:
+    def __init__(self, size):
+        self.size = size
+        self._members = {}
+        self._heap = []
+
+    def update(self, key, volume):
+        members = self._members
+        if key in members:
+            members[key] = volume
+            return
+
+        if len(members) < self.size:
+            members[key] = volume
+            heappush(self._heap, (volume, key))
+            return
+
+        self._refresh_minimum()
+        if volume > self._heap[0][0]:
+            _, evicted = heapreplace(self._heap, (volume, key))
+            del members[evicted]
+            members[key] = volume
+
+    def _refresh_minimum(self):
+        heap = self._heap
+        members = self._members
+        while heap[0][0] != members[heap[0][1]]:
+            key = heap[0][1]
+            heapreplace(heap, (members[key], key))
+
+    def items(self, count=None):
+        ranked = sorted(
+            self._members.items(), key=lambda item: item[1], reverse=True
+        )
+        return ranked[:count] if count is not None else ranked
+
+
+class BankAggregates:
+    def __init__(self, top=100):
+        self.total = Totals()
+        self.days = defaultdict(Totals)
+        self.branches = defaultdict(Totals)
+        self.branch_days = defaultdict(Totals)
+        self.balance = 0.0
+        self.branch_balances = defaultdict(float)
+        self.volumes = {}
+        self.top = TopK(top)
+
+    @classmethod
+    def from_accounts(cls, accounts, top=100):
+        aggregates = cls(top)
+        for account in accounts:
+            for entry in account.history.iter_transactions():
+                aggregates.record(account, entry, update_balance=False)
+            aggregates.balance += account.balance
+            aggregates.branch_balances[account.branch] += account.balance
+        return aggregates
+
+    def attach(self):
+        core.transaction_listeners.append(self)
+        return self
+
+    def detach(self):
+        core.transaction_listeners.remove(self)
+
+    def __call__(self, account, entry):
+        self.record(account, entry)
+
+    def record(self, account, entry, update_balance=True):
+        kind = entry["type"]
+        amount = entry["amount"]
+        branch = account.branch
+        day = entry["date"][:10]
+
+        self.total.add(kind, amount)
+        self.days[day].add(kind, amount)
+        self.branches[branch].add(kind, amount)
+        self.branch_days[(branch, day)].add(kind, amount)
+
+        if update_balance:
+            delta = -amount if kind in DEBITS else amount
+            self.balance += delta
+            self.branch_balances[branch] += delta
+
+        key = (branch, account.number)
+        volume = self.volumes.get(key, 0.0) + amount
+        self.volumes[key] = volume
+        self.top.update(key, volume)
+
+    def daily_report(self, day=None, branch=None):
+        day = day_key(day or date.today())
+        if branch is None:
+            totals = self.days.get(day, Totals())
+            balance = self.balance
+        else:
+            totals = self.branch_days.get((branch, day), Totals())
+            balance = self.branch_balances.get(branch, 0.0)
+
+        return {
+            "day": day,
+            "branch": branch,
+            **totals.as_dict(),
+            "balance_under_management": balance,
+        }
+
+    def top_accounts(self, count=None):
+        return self.top.items(count)
+
+
+def benchmark(accounts=100_000, transactions=1_000_000):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    bank = [
+        CheckingAccount.new_account(client, number)
+        for number in range(1, accounts + 1)
+    ]
+    kinds = (Deposit.__name__, Withdrawal.__name__)
+    today = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+
+    aggregates = BankAggregates()
+    start = time.perf_counter()
+    for _ in range(transactions):
+        entry = {
+            "type": kinds[randrange(2)],
+            "amount": float(randrange(1, 500)),
+            "date": today,
+        }
+        aggregates.record(bank[randrange(accounts)], entry)
+    elapsed = time.perf_counter() - start
+    print(f"Updates: {transactions / elapsed:,.0f} transactions/s")
+
+    start = time.perf_counter()
+    aggregates.daily_report()
+    aggregates.top_accounts()
+    elapsed = time.perf_counter() - start
+    print(f"Daily report and top 100: {elapsed * 1e6:,.0f} us")
+
+
+if __name__ == "__main__":
+    benchmark()
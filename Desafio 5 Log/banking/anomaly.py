@@ -0,0 +1,185 @@
+import math
+import time
+from collections import deque
+
+from . import core
+from .core import CheckingAccount, Deposit, Individual, Withdrawal
+
+WITHDRAWAL = Withdrawal.__name__
+
+
+class AccountStats:
+    __slots__ = (
+        "count",
+        "mean",
+        "variance",
+        "rate",
+        "last_seen",
+        "day",
+        "today",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.variance = 0.0
+        self.rate = 0.0
+        self.last_seen = None
+        self.day = None
+        self.today = 0
+
+    def add_amount(self, amount, alpha):
+        self.count += 1
+        weight = max(alpha, 1 / self.count)
+        delta = amount - self.mean
+        self.mean += weight * delta
+        self.variance = (1 - weight) * (self.variance + weight * delta**2)
+
+    def add_event(self, now, day, window):
+        if self.last_seen is not None:
+            self.rate *= math.exp(-(now - self.last_seen) / window)
+        self.rate += 1 / window
+        self.last_seen = now
+
+        if self.day != day:
+            self.day = day
+            self.today = 0
+        self.today += 1
+
+
+class Alert:
+    __slots__ = ("reason", "branch", "number", "amount", "date", "detail")
+
+    def __init__(self, reason, account, entry, detail):
+        self.reason = reason
+        self.branch = account.branch
+        self.number = account.number
+        self.amount = entry["amount"]
+        self.date = entry["date"]
+        self.detail = detail
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: {self.reason} "
+            f"('{self.branch}', '{self.number}') {self.detail}>"
+        )
+
+
+class AnomalyDetector:
+    def __init__(
+        self,
+        z_threshold=3.0,
+        min_samples=5,
+        limit_ratio=0.9,
+        cap_ratio=0.8,
+        burst_per_minute=5.0,
+        window=60.0,
+        span=30,
+        max_alerts=10_000,
+        on_alert=None,
+    ):
+        self.z_threshold = z_threshold
+        self.min_samples = min_samples
+        self.limit_ratio = limit_ratio
+        self.cap_ratio = cap_ratio
+        self.burst_rate = burst_per_minute / 60
+        self.window = window
+        self.alpha = 2 / (span + 1)
+        self.on_alert = on_alert
+        self.alerts = deque(maxlen=max_alerts)
+        self._stats = {}
+
+    def attach(self):
+        core.transaction_listeners.append(self)
+        return self
+
+    def detach(self):
+        core.transaction_listeners.remove(self)
+
+    def stats(self, account):
+        return self._stats.get((account.branch, account.number))
+
+    def __call__(self, account, entry):
+        self.observe(account, entry)
+
+    def observe(self, account, entry, now=None):
+        key = (account.branch, account.number)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = AccountStats()
+
+        stats.add_event(
+            now if now is not None else time.time(),
+            entry["date"][:10],
+            self.window,
+        )
+
+        if stats.rate > self.burst_rate:
+            self._alert(
+                "burst", account, entry, f"{stats.rate * 60:.1f} per minute"
+            )
+
+        cap = account.daily_transaction_limit
+        if stats.today >= cap * self.cap_ratio:
+            self._alert(
+                "near_daily_cap", account, entry, f"{stats.today} of {cap}"
+            )
+
+        if entry["type"] != WITHDRAWAL:
+            return
+
+        amount = entry["amount"]
+        limit = getattr(account, "_limit", None)
+        if limit and amount >= limit * self.limit_ratio:
+            self._alert(
+                "near_limit", account, entry, f"{amount:.2f} of {limit:.2f}"
+            )
+
+        if stats.count >= self.min_samples:
+            deviation = math.sqrt(stats.variance)
+            if deviation and (amount - stats.mean) / deviation > (
+                self.z_threshold
+            ):
+                self._alert(
+                    "large_withdrawal",
+                    account,
+                    entry,
+                    f"mean {stats.mean:.2f}, deviation {deviation:.2f}",
+                )
+        stats.add_amount(amount, self.alpha)
+
+    def _alert(self, reason, account, entry, detail):
+        alert = Alert(reason, account, entry, detail)
+        self.alerts.append(alert)
+        if self.on_alert:
+            self.on_alert(alert)
+
+
+def benchmark(accounts=10_000, transactions=500_000):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    bank = [
+        CheckingAccount.new_account(client, number)
+        for number in range(1, accounts + 1)
+    ]
+    deposit = Deposit(100)
+    withdrawal = Withdrawal(50)
+
+    def run():
+        start = time.perf_counter()
+        for index in range(transactions):
+            account = bank[index % accounts]
+            (withdrawal if index % 3 else deposit).commit(account)
+        return (time.perf_counter() - start) / transactions * 1e6
+
+    baseline = run()
+    detector = AnomalyDetector(burst_per_minute=1_000).attach()
+    observed = run()
+    detector.detach()
+
+    print(f"Commit without detector: {baseline:.2f} us")
+    print(f"Commit with detector: {observed:.2f} us")
+    print(f"Alerts raised: {len(detector.alerts):,}")
+
+
+if __name__ == "__main__":
+    benchmark()
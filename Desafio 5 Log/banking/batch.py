@@ -0,0 +1,166 @@
+import os
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from . import core
+from .aggregates import DEBITS
+from .core import CheckingAccount, Deposit, Fee, Individual, Withdrawal
+
+
+class BatchRejected(Exception):
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(
+            f"Batch rejected: {len(errors)} operation(s) failed validation."
+        )
+
+
+def balance_error(kind, amount, balance):
+    if amount <= 0:
+        return "The amount entered is invalid."
+    if kind == Withdrawal.__name__ and amount > balance:
+        return "You do not have enough balance."
+    return None
+
+
+class AtomicBatch:
+    def __init__(self):
+        self._operations = []
+        self.committed = False
+
+    def __len__(self):
+        return len(self._operations)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+    def add(self, account, transaction):
+        if self.committed:
+            raise RuntimeError("Batch has already been committed.")
+        self._operations.append((account, transaction))
+
+    def deposit(self, account, amount):
+        self.add(account, Deposit(amount))
+
+    def withdraw(self, account, amount):
+        self.add(account, Withdrawal(amount))
+
+    def charge(self, account, amount):
+        self.add(account, Fee(amount))
+
+    def discard(self):
+        self._operations.clear()
+
+    def validate(self, now=None):
+        now = now or datetime.now()
+        shadows = {}
+        deltas = {}
+        errors = []
+
+        for index, (account, transaction) in enumerate(self._operations):
+            limits = shadows.get(account)
+            if limits is None:
+                limits = shadows[account] = account.limits.copy()
+                deltas[account] = 0
+
+            kind = transaction.__class__.__name__
+            amount = transaction.amount
+            error = (
+                balance_error(kind, amount, account.balance + deltas[account])
+                or limits.check_transaction(kind, amount, now)
+                or limits.check(kind, amount, now)
+            )
+            if error:
+                errors.append((index, account, error))
+                continue
+
+            limits.record(kind, amount, now)
+            deltas[account] += -amount if kind in DEBITS else amount
+
+        return shadows, deltas, errors
+
+    def commit(self):
+        if self.committed:
+            raise RuntimeError("Batch has already been committed.")
+
+        now = datetime.now()
+        shadows, deltas, errors = self.validate(now)
+        if errors:
+            self.discard()
+            raise BatchRejected(errors)
+
+        date = now.strftime("%d-%m-%Y %H:%M:%S")
+        balances = {account: account.balance for account in deltas}
+        entries = []
+        for account, transaction in self._operations:
+            amount = transaction.amount
+            balances[account] += (
+                -amount if transaction.__class__.__name__ in DEBITS else amount
+            )
+            entries.append(
+                account.history.add_transaction(
+                    transaction, date, balances[account]
+                )
+            )
+
+        for account, delta in deltas.items():
+            account._balance += delta
+            account._limits = shadows[account]
+
+        for (account, _), entry in zip(self._operations, entries):
+            core.notify_listeners(account, entry)
+
+        self.committed = True
+        return len(self._operations)
+
+
+def benchmark(accounts=20_000, operations=100_000):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+
+    def open_accounts():
+        bank = [
+            CheckingAccount.new_account(client, number)
+            for number in range(1, accounts + 1)
+        ]
+        for account in bank:
+            account.limits.rules
+        return bank
+
+    bank = open_accounts()
+    deposits = [Deposit(100) for _ in range(operations)]
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for index, deposit in enumerate(deposits):
+            account = bank[index % accounts]
+            client.perform_transaction(account, deposit)
+    one_by_one = time.perf_counter() - start
+
+    bank = open_accounts()
+    start = time.perf_counter()
+    with AtomicBatch() as batch:
+        for index, deposit in enumerate(deposits):
+            batch.add(bank[index % accounts], deposit)
+    batched = time.perf_counter() - start
+
+    print(f"One by one: {operations / one_by_one:,.0f} operations/s")
+    print(f"Atomic batch: {operations / batched:,.0f} operations/s")
+
+    batch = AtomicBatch()
+    batch.deposit(bank[0], 100)
+    batch.withdraw(bank[1], 10_000)
+    try:
+        batch.commit()
+    except BatchRejected as error:
+        print(f"{error} First error: {error.errors[0][2]}")
+
+
+if __name__ == "__main__":
+    benchmark()
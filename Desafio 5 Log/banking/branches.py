@@ -0,0 +1,241 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import core, listing
+from .aggregates import BankAggregates
+from .core import DEFAULT_BRANCH, CheckingAccount, Individual, PrefixView
+
+
+class _DetachedSequence:
+    def __init__(self, code):
+        self.code = code
+
+    def next(self):
+        raise RuntimeError(
+            f"Branch {self.code} is a copy in another process and cannot "
+            "allocate account numbers."
+        )
+
+
+class Branch:
+    def __init__(self, code, account_class=CheckingAccount, sequence=None):
+        self.code = code
+        self.account_class = account_class
+        self.sequence = sequence
+        self.accounts = []
+        self.aggregates = BankAggregates()
+        self._by_number = {}
+        self._next_number = 1
+        self._ordered = True
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        if self.sequence is not None:
+            state["sequence"] = _DetachedSequence(self.code)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.accounts)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}:{self.code}>"
+
+    def next_number(self):
+        if self.sequence is None:
+            with self._lock:
+                number = self._next_number
+                self._next_number += 1
+            return number
+
+        number = self.sequence.next()
+        while number in self._by_number:
+            number = self.sequence.next()
+        return number
+
+    def open_account(self, client, **options):
+        account = self.account_class.new_account(
+            client, self.next_number(), branch=self.code, **options
+        )
+        self.add_account(account)
+        client.add_account(account)
+        return account
+
+    def add_account(self, account):
+        if account.branch != self.code:
+            raise ValueError(
+                f"Account {account.number} belongs to branch {account.branch}."
+            )
+
+        with self._lock:
+            if account.number in self._by_number:
+                raise ValueError(
+                    f"Account {account.number} already exists "
+                    f"in branch {self.code}."
+                )
+            self._by_number[account.number] = account
+            if self.accounts and account.number < self.accounts[-1].number:
+                self._ordered = False
+            self.accounts.append(account)
+            self._next_number = max(self._next_number, account.number + 1)
+
+    def get_account(self, number):
+        return self._by_number.get(number)
+
+    def snapshot(self):
+        return PrefixView(self.accounts)
+
+    def page(self, cursor=None, page_size=50, client=None):
+        accounts = self.snapshot()
+        if client is not None or not self._ordered:
+            return listing.page(accounts, cursor, page_size, client)
+
+        low = 0
+        if cursor is not None and cursor[0] == self.code:
+            high = len(accounts)
+            while low < high:
+                middle = (low + high) // 2
+                if accounts[middle].number <= cursor[1]:
+                    low = middle + 1
+                else:
+                    high = middle
+        elif cursor is not None and cursor[0] > self.code:
+            low = len(accounts)
+
+        chosen = [
+            accounts[index]
+            for index in range(low, min(low + page_size, len(accounts)))
+        ]
+        if low + page_size < len(accounts):
+            return listing.Page(chosen, listing.sort_key(chosen[-1]))
+        return listing.Page(chosen, None)
+
+
+class Bank:
+    def __init__(self, branch_class=Branch, allocator=None):
+        self.branch_class = branch_class
+        self.allocator = allocator
+        self.branches = {}
+        self.clients = {}
+        self._lock = threading.Lock()
+
+    def branch(self, code=DEFAULT_BRANCH):
+        branch = self.branches.get(code)
+        if branch is None:
+            with self._lock:
+                branch = self.branches.get(code)
+                if branch is None:
+                    sequence = (
+                        self.allocator.sequence(code)
+                        if self.allocator
+                        else None
+                    )
+                    branch = self.branches[code] = self.branch_class(
+                        code, sequence=sequence
+                    )
+        return branch
+
+    def add_client(self, client):
+        if client.cpf in self.clients:
+            raise ValueError(f"A client with cpf {client.cpf} already exists.")
+        self.clients[client.cpf] = client
+        return client
+
+    def find_client(self, cpf):
+        return self.clients.get(cpf)
+
+    def open_account(self, client, branch=DEFAULT_BRANCH, **options):
+        return self.branch(branch).open_account(client, **options)
+
+    def add_account(self, account):
+        self.branch(account.branch).add_account(account)
+
+    def get_account(self, branch, number):
+        partition = self.branches.get(branch)
+        return partition.get_account(number) if partition else None
+
+    def accounts(self):
+        branches = self.branches.copy()
+        for code in sorted(branches):
+            yield from branches[code].snapshot()
+
+    def page(self, cursor=None, page_size=50, client=None):
+        if client is not None:
+            return listing.page(client.accounts, cursor, page_size)
+
+        branches = self.branches.copy()
+        codes = [
+            code
+            for code in sorted(branches)
+            if cursor is None or code >= cursor[0]
+        ]
+        chosen = []
+        for position, code in enumerate(codes):
+            current = branches[code].page(cursor, page_size - len(chosen))
+            chosen += current.accounts
+            if current.cursor is not None:
+                return listing.Page(chosen, current.cursor)
+            if len(chosen) == page_size:
+                later = codes[position + 1 :]
+                if any(len(branches[code]) for code in later):
+                    return listing.Page(chosen, listing.sort_key(chosen[-1]))
+                break
+        return listing.Page(chosen, None)
+
+    def attach(self):
+        core.transaction_listeners.append(self)
+        return self
+
+    def detach(self):
+        core.transaction_listeners.remove(self)
+
+    def __call__(self, account, entry):
+        self.branch(account.branch).aggregates.record(account, entry)
+
+    def run_parallel(self, job, executor=None, max_workers=None):
+        codes = sorted(self.branches)
+        branches = [self.branches[code] for code in codes]
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                results = list(pool.map(job, branches))
+        else:
+            results = list(executor.map(job, branches))
+        return dict(zip(codes, results))
+
+
+def benchmark(operations=20_000, sizes=(0, 100_000, 1_000_000)):
+    bank = Bank()
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    bank.add_client(client)
+    entry = {"type": "Deposit", "amount": 100.0, "date": "01-01-2024"}
+
+    other = bank.branch("0002")
+    for size in sizes:
+        while len(other) < size:
+            other.add_account(
+                CheckingAccount(len(other) + 1, client, branch="0002")
+            )
+
+        code = f"{1_000 + len(bank.branches):04d}"
+        start = time.perf_counter()
+        for _ in range(operations):
+            account = bank.open_account(client, code)
+            bank.get_account(code, account.number)
+            bank(account, entry)
+        elapsed = time.perf_counter() - start
+        client.accounts.clear()
+
+        print(
+            f"Other branch with {size:>9,} accounts: "
+            f"{elapsed / operations * 1e6:.2f} us per operation"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
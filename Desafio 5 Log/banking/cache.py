@@ -0,0 +1,217 @@
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from random import paretovariate
+
+from .core import CheckingAccount, Deposit, Individual
+from .storage import SQLiteRepository
+
+
+class CacheStats:
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.writes = 0
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __str__(self):
+        return (
+            f"Hits: {self.hits:,}  Misses: {self.misses:,}  "
+            f"Evictions: {self.evictions:,}  Writes: {self.writes:,}  "
+            f"Hit rate: {self.hit_rate:.1%}"
+        )
+
+
+class AccountCache:
+    def __init__(
+        self,
+        repository,
+        max_accounts=10_000,
+        max_transactions=None,
+        history_limit=100,
+    ):
+        self.repository = repository
+        self.max_accounts = max_accounts
+        self.max_transactions = max_transactions
+        self.history_limit = history_limit
+        self.stats = CacheStats()
+        self._accounts = OrderedDict()
+        self._sizes = {}
+        self._transactions = 0
+        self._pins = Counter()
+        self._retired = weakref.WeakValueDictionary()
+        self._clients = weakref.WeakValueDictionary()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._accounts)
+
+    def __contains__(self, key):
+        return key in self._accounts
+
+    def get(self, branch, number):
+        key = (branch, number)
+        with self._lock:
+            account = self._accounts.get(key)
+            if account is not None:
+                self._accounts.move_to_end(key)
+                self._resize(key, account)
+                self.stats.hits += 1
+                return account
+
+            account = self._retired.pop(key, None)
+            if account is not None:
+                self.stats.hits += 1
+                self._insert(key, account)
+                return account
+            self.stats.misses += 1
+
+        account = self.repository.load_account(
+            branch,
+            number,
+            history_limit=self.history_limit,
+            clients=self._clients,
+        )
+        if account is None:
+            return None
+
+        with self._lock:
+            cached = self._accounts.get(key)
+            if cached is None:
+                cached = self._retired.pop(key, None)
+                if cached is not None:
+                    self._insert(key, cached)
+            if cached is not None:
+                return cached
+            self._clients.setdefault(account.client.cpf, account.client)
+            self._insert(key, account)
+        return account
+
+    @contextmanager
+    def checkout(self, branch, number):
+        key = (branch, number)
+        with self._lock:
+            self._pins[key] += 1
+        try:
+            yield self.get(branch, number)
+        finally:
+            with self._lock:
+                self._pins[key] -= 1
+                if not self._pins[key]:
+                    del self._pins[key]
+                self._evict()
+
+    def put(self, account):
+        key = (account.branch, account.number)
+        with self._lock:
+            if key in self._accounts:
+                self._accounts.move_to_end(key)
+                self._resize(key, account)
+            else:
+                self._retired.pop(key, None)
+                self._insert(key, account)
+
+    def flush(self):
+        with self._lock:
+            accounts = list(self._accounts.values())
+        self.repository.save_accounts(accounts)
+        self.stats.writes += len(accounts)
+
+    def clear(self):
+        self.flush()
+        with self._lock:
+            self._accounts.clear()
+            self._sizes.clear()
+            self._transactions = 0
+
+    def _insert(self, key, account):
+        self._accounts[key] = account
+        self._sizes[key] = 0
+        self._resize(key, account)
+        self._evict()
+
+    def _resize(self, key, account):
+        size = len(account.history.transactions)
+        self._transactions += size - self._sizes[key]
+        self._sizes[key] = size
+
+    def _over_budget(self):
+        if len(self._accounts) > self.max_accounts:
+            return True
+        return (
+            self.max_transactions is not None
+            and self._transactions > self.max_transactions
+            and len(self._accounts) > 1
+        )
+
+    def _evict(self):
+        while self._over_budget():
+            key = next(
+                (key for key in self._accounts if key not in self._pins),
+                None,
+            )
+            if key is None:
+                return
+            account = self._accounts.pop(key)
+            self._transactions -= self._sizes.pop(key)
+            self.repository.sync_account(account)
+            self._retired[key] = account
+            self.stats.evictions += 1
+            self.stats.writes += 1
+
+
+def benchmark(accounts=20_000, cached=2_000, lookups=200_000):
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteRepository(os.path.join(directory, "bank.db")) as repo:
+            clients = []
+            bank = []
+            deposit = Deposit(100)
+            for number in range(1, accounts + 1):
+                client = Individual(
+                    name=f"Client {number}",
+                    birth_date="01-01-1990",
+                    cpf=f"{number:011d}",
+                    address="Street, 1 - Center - City/ST",
+                )
+                account = CheckingAccount.new_account(client, number)
+                account.history.add_transaction(deposit)
+                client.add_account(account)
+                clients.append(client)
+                bank.append(account)
+            repo.save_clients(clients)
+            repo.save_accounts(bank)
+
+            in_memory = {(a.branch, a.number): a for a in bank}
+            numbers = [
+                min(int(paretovariate(1.2)), accounts)
+                for _ in range(lookups)
+            ]
+
+            start = time.perf_counter()
+            for number in numbers:
+                in_memory[("0001", number)]
+            baseline = time.perf_counter() - start
+
+            cache = AccountCache(repo, max_accounts=cached)
+            start = time.perf_counter()
+            for number in numbers:
+                cache.get("0001", number)
+            elapsed = time.perf_counter() - start
+            cache.flush()
+
+    print(cache.stats)
+    print(f"In-memory lookup: {baseline / lookups * 1e9:,.0f} ns")
+    print(f"Cached lookup: {elapsed / lookups * 1e9:,.0f} ns")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,315 @@
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime
+from itertools import islice
+
+from .idempotency import DedupeTable
+from .limits import TRANSACTION, AccountLimits, AmountCap, FixedDayWindow
+
+DEFAULT_BRANCH = "0001"
+
+transaction_listeners = []
+listener_errors = Counter()
+
+
+def notify_listeners(account, entry):
+    for listener in transaction_listeners:
+        try:
+            listener(account, entry)
+        except Exception:
+            name = getattr(listener, "__name__", type(listener).__name__)
+            listener_errors[name] += 1
+
+
+class Client:
+    dedupe_table = DedupeTable()
+
+    def __init__(self, address):
+        self.address = address
+        self.accounts = []
+
+    def perform_transaction(self, account, transaction, idempotency_key=None):
+        if idempotency_key is None:
+            return self._perform_transaction(account, transaction)
+
+        return self.dedupe_table.run(
+            (account.branch, account.number, idempotency_key),
+            lambda: self._perform_transaction(account, transaction),
+        )
+
+    def _perform_transaction(self, account, transaction):
+        if error := account.limits.check_transaction(
+            transaction.__class__.__name__, transaction.amount
+        ):
+            print(f"\nOperation failed! {error}")
+            return False
+
+        return transaction.record(account)
+
+    def add_account(self, account):
+        self.accounts.append(account)
+
+
+class Individual(Client):
+    def __init__(self, name, birth_date, cpf, address):
+        super().__init__(address)
+        self.name = name
+        self.birth_date = birth_date
+        self.cpf = cpf
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}:{self.cpf}>"
+
+
+class Account:
+    daily_transaction_limit = 10
+
+    def __init__(self, number, client, branch=DEFAULT_BRANCH):
+        self._balance = 0
+        self._number = number
+        self._branch = branch
+        self._client = client
+        self._history = History()
+        self._limits = None
+
+    @classmethod
+    def new_account(cls, client, number, branch=DEFAULT_BRANCH):
+        return cls(number, client, branch=branch)
+
+    @property
+    def balance(self):
+        return self._balance
+
+    @property
+    def number(self):
+        return self._number
+
+    @property
+    def branch(self):
+        return self._branch
+
+    @property
+    def client(self):
+        return self._client
+
+    @property
+    def history(self):
+        return self._history
+
+    def snapshot(self):
+        history = self.history.snapshot()
+        balance = history.balance
+        return history, self.balance if balance is None else balance
+
+    @property
+    def limits(self):
+        if self._limits is None:
+            self._limits = AccountLimits(self.limit_rules())
+        return self._limits
+
+    def limit_rules(self):
+        return {
+            TRANSACTION: [
+                FixedDayWindow(
+                    self.daily_transaction_limit,
+                    "Maximum number of transactions on a day exceeded.",
+                )
+            ]
+        }
+
+    def withdraw(self, amount):
+        balance = self.balance
+        exceeded_balance = amount > balance
+
+        if exceeded_balance:
+            print("\nOperation failed! You do not have enough balance. ")
+
+        elif amount > 0:
+            self._balance -= amount
+            print("\nWithdrawal successful!")
+            return True
+
+        else:
+            print("\nOperation failed! The amount entered is invalid. ")
+
+        return False
+
+    def deposit(self, amount):
+        if amount > 0:
+            self._balance += amount
+            print("\n======== Deposit successful! =========")
+        else:
+            print("\nOperation failed! The amount entered is invalid. ")
+            return False
+
+        return True
+
+    def charge(self, amount):
+        if amount <= 0:
+            return False
+
+        self._balance -= amount
+        return True
+
+
+class CheckingAccount(Account):
+    def __init__(
+        self,
+        number,
+        client,
+        limit=500,
+        withdrawal_limit=3,
+        branch=DEFAULT_BRANCH,
+    ):
+        super().__init__(number, client, branch=branch)
+        self._limit = limit
+        self._withdrawal_limit = withdrawal_limit
+
+    def limit_rules(self):
+        rules = super().limit_rules()
+        rules[Withdrawal.__name__] = [
+            AmountCap(
+                self._limit, "The withdrawal amount exceeds the limit."
+            ),
+            FixedDayWindow(
+                self._withdrawal_limit,
+                "Maximum number of withdrawals exceeded.",
+            ),
+        ]
+        return rules
+
+    def withdraw(self, amount):
+        if error := self.limits.check(Withdrawal.__name__, amount):
+            print(f"\nOperation failed! {error}")
+            return False
+
+        return super().withdraw(amount)
+
+    def __repr__(self) -> str:
+        return f"""<{self.__class__.__name__}: ('{self.branch}',
+        '{self.number}', '{self.client.name}>'"""
+
+    def __str__(self):
+        return f"""
+Agency: {self.branch}
+Account: {self.number}
+Owner: {self.client.name}
+"""
+
+
+class PrefixView:
+    __slots__ = ("_items", "_length")
+
+    def __init__(self, items, length=None):
+        self._items = items
+        self._length = len(items) if length is None else length
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return islice(self._items, self._length)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("view index out of range")
+        return self._items[index]
+
+
+class HistorySnapshot(PrefixView):
+    __slots__ = ()
+
+    @property
+    def balance(self):
+        if not self._length:
+            return None
+        return self._items[self._length - 1].get("balance")
+
+
+class History:
+    def __init__(self):
+        self._transactions = []
+
+    @property
+    def transactions(self):
+        return self._transactions
+
+    def iter_transactions(self):
+        return iter(self._transactions)
+
+    def snapshot(self):
+        return HistorySnapshot(self._transactions)
+
+    def add_transaction(self, transaction, date=None, balance=None):
+        entry = {
+            "type": transaction.__class__.__name__,
+            "amount": transaction.amount,
+            "date": date or datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
+        }
+        if balance is not None:
+            entry["balance"] = balance
+        self._transactions.append(entry)
+        return entry
+
+
+class Transaction(ABC):
+    @property
+    @abstractmethod
+    def amount(self):
+        pass
+
+    @abstractmethod
+    def record(self, account):
+        pass
+
+    def commit(self, account):
+        entry = account.history.add_transaction(self, balance=account.balance)
+        account.limits.record(self.__class__.__name__, self.amount)
+        notify_listeners(account, entry)
+
+
+class Withdrawal(Transaction):
+    def __init__(self, amount):
+        self._amount = amount
+
+    @property
+    def amount(self):
+        return self._amount
+
+    def record(self, account):
+        if account.withdraw(self.amount):
+            self.commit(account)
+            return True
+        return False
+
+
+class Deposit(Transaction):
+    def __init__(self, amount):
+        self._amount = amount
+
+    @property
+    def amount(self):
+        return self._amount
+
+    def record(self, account):
+        if account.deposit(self.amount):
+            self.commit(account)
+            return True
+        return False
+
+
+class Fee(Transaction):
+    def __init__(self, amount):
+        self._amount = amount
+
+    @property
+    def amount(self):
+        return self._amount
+
+    def record(self, account):
+        if account.charge(self.amount):
+            self.commit(account)
+            return True
+        return False
@@ -0,0 +1,237 @@
+import os
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from functools import partial
+from itertools import islice
+
+from .aggregates import day_key
+from .core import CheckingAccount, Deposit, Fee, Individual, Withdrawal
+
+
+class Stage:
+    def __init__(self, name, compute=None, apply=None, adjust=None):
+        self.name = name
+        self.compute = compute
+        self.apply = apply
+        self.adjust = adjust
+
+
+class PipelineReport:
+    def __init__(self, day):
+        self.day = day
+        self.accounts = 0
+        self.chunks = 0
+        self.elapsed = 0.0
+        self.timings = defaultdict(float)
+
+    @property
+    def accounts_per_second(self):
+        return self.accounts / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        lines = [
+            f"End of day {self.day}: {self.accounts:,} accounts in "
+            f"{self.chunks:,} chunks, {self.elapsed:.2f}s "
+            f"({self.accounts_per_second:,.0f} accounts/s)"
+        ]
+        lines += [
+            f"  {name}: {seconds:.3f}s"
+            for name, seconds in self.timings.items()
+        ]
+        return "\n".join(lines)
+
+
+def extract_chunk(accounts, day):
+    entries = []
+    for account in accounts:
+        entries.append(
+            [
+                (entry["type"], entry["amount"], entry["date"])
+                for entry in account.history.iter_transactions()
+                if entry["date"].startswith(day)
+            ]
+        )
+    return {
+        "branches": [account.branch for account in accounts],
+        "numbers": [account.number for account in accounts],
+        "names": [account.client.name for account in accounts],
+        "balances": [account.balance for account in accounts],
+        "entries": entries,
+    }
+
+
+def render_statements(chunk, day):
+    statements = []
+    for branch, number, name, balance, entries in zip(
+        chunk["branches"],
+        chunk["numbers"],
+        chunk["names"],
+        chunk["balances"],
+        chunk["entries"],
+    ):
+        lines = [f"Agency: {branch}\nAccount: {number}\nOwner: {name}\n"]
+        lines += [
+            f"{kind}:\t$ {amount:.2f}\tDate:\t{moment}"
+            for kind, amount, moment in entries
+        ]
+        lines.append(f"\nBalance:\t$ {balance:.2f}")
+        statements.append("\n".join(lines))
+    return statements
+
+
+def snapshot_balances(chunk, day):
+    return list(zip(chunk["branches"], chunk["numbers"], chunk["balances"]))
+
+
+def assess_fees(chunk, day, fee_per_withdrawal=0.0):
+    withdrawal = Withdrawal.__name__
+    withdrawals = [
+        sum(1 for kind, _, _ in entries if kind == withdrawal)
+        for entries in chunk["entries"]
+    ]
+    return [count * fee_per_withdrawal for count in withdrawals]
+
+
+def post_fees(chunk, fees, day):
+    posted = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
+    balances = chunk["balances"]
+    for index, fee in enumerate(fees):
+        if fee > 0:
+            balances[index] -= fee
+            chunk["entries"][index].append((Fee.__name__, fee, posted))
+
+
+def charge_fees(accounts, fees, day):
+    for account, fee in zip(accounts, fees):
+        if fee > 0:
+            Fee(fee).record(account)
+
+
+def roll_over_counters(accounts, result, day):
+    now = datetime.now()
+    for account in accounts:
+        account.limits.expire(now)
+
+
+def default_stages(fee_per_withdrawal=0.0):
+    return [
+        Stage(
+            "fees",
+            partial(assess_fees, fee_per_withdrawal=fee_per_withdrawal),
+            charge_fees,
+            post_fees,
+        ),
+        Stage("statements", render_statements),
+        Stage("snapshot", snapshot_balances),
+        Stage("rollover", apply=roll_over_counters),
+    ]
+
+
+def run_chunk(stages, chunk, day):
+    results = {}
+    timings = {}
+    for name, compute, adjust in stages:
+        start = time.perf_counter()
+        results[name] = compute(chunk, day)
+        if adjust:
+            adjust(chunk, results[name], day)
+        timings[name] = time.perf_counter() - start
+    return results, timings
+
+
+class EndOfDayPipeline:
+    def __init__(
+        self, stages=None, chunk_size=10_000, max_workers=None, sink=None
+    ):
+        self.stages = stages if stages is not None else default_stages()
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.sink = sink
+
+    def run(self, accounts, day=None, executor=None):
+        day = day_key(day or date.today())
+        report = PipelineReport(day)
+        start = time.perf_counter()
+
+        if executor is None:
+            with ProcessPoolExecutor(self.max_workers) as pool:
+                self._run(pool, accounts, day, report)
+        else:
+            self._run(executor, accounts, day, report)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _run(self, executor, accounts, day, report):
+        computed = [
+            (stage.name, stage.compute, stage.adjust)
+            for stage in self.stages
+            if stage.compute
+        ]
+        pending = deque()
+        accounts = iter(accounts)
+
+        while True:
+            while len(pending) < self.max_workers * 2:
+                batch = list(islice(accounts, self.chunk_size))
+                if not batch:
+                    break
+                start = time.perf_counter()
+                chunk = extract_chunk(batch, day)
+                report.timings["extract"] += time.perf_counter() - start
+                pending.append(
+                    (batch, executor.submit(run_chunk, computed, chunk, day))
+                )
+
+            if not pending:
+                break
+
+            batch, future = pending.popleft()
+            results, timings = future.result()
+            for name, seconds in timings.items():
+                report.timings[name] += seconds
+            self._apply(batch, results, day, report)
+            report.accounts += len(batch)
+            report.chunks += 1
+
+    def _apply(self, batch, results, day, report):
+        for stage in self.stages:
+            result = results.get(stage.name)
+            if stage.apply:
+                start = time.perf_counter()
+                stage.apply(batch, result, day)
+                report.timings[f"{stage.name} (apply)"] += (
+                    time.perf_counter() - start
+                )
+            if result is not None and self.sink:
+                start = time.perf_counter()
+                self.sink(stage.name, batch, result, day)
+                report.timings[f"{stage.name} (sink)"] += (
+                    time.perf_counter() - start
+                )
+
+
+def benchmark(accounts=100_000, transactions=5):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    deposit = Deposit(100)
+    withdrawal = Withdrawal(10)
+    bank = []
+    for number in range(1, accounts + 1):
+        account = CheckingAccount.new_account(client, number)
+        for _ in range(transactions):
+            deposit.commit(account)
+        withdrawal.commit(account)
+        bank.append(account)
+
+    for workers in sorted({1, os.cpu_count() or 1}):
+        pipeline = EndOfDayPipeline(
+            default_stages(fee_per_withdrawal=0.5), max_workers=workers
+        )
+        print(f"{workers} worker(s)")
+        print(pipeline.run(bank))
+
+
+if __name__ == "__main__":
+    benchmark()
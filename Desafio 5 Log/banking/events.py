@@ -0,0 +1,237 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+
+from . import core
+from .core import CheckingAccount, Deposit, Individual
+
+BLOCK = "block"
+DROP_OLDEST = "drop_oldest"
+SPILL = "spill"
+POLICIES = (BLOCK, DROP_OLDEST, SPILL)
+
+
+def transaction_event(account, entry):
+    return {
+        "branch": account.branch,
+        "number": account.number,
+        "cpf": getattr(account.client, "cpf", None),
+        "type": entry["type"],
+        "amount": entry["amount"],
+        "date": entry["date"],
+        "balance": account.balance,
+    }
+
+
+class Subscription:
+    def __init__(
+        self,
+        callback,
+        maxsize=10_000,
+        policy=DROP_OLDEST,
+        spill_path=None,
+        block_timeout=1.0,
+    ):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        if policy == SPILL and not spill_path:
+            raise ValueError("The spill policy needs a spill_path.")
+
+        self.callback = callback
+        self.maxsize = maxsize
+        self.policy = policy
+        self.spill_path = spill_path
+        self.block_timeout = block_timeout
+        self.delivered = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.errors = 0
+
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._discard = False
+        self._spilling = False
+        self._spill_file = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def offer(self, event):
+        with self._condition:
+            if self._closed:
+                return False
+
+            if self._spilling or len(self._queue) >= self.maxsize:
+                if self.policy == DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif self.policy == SPILL:
+                    self._spill(event)
+                    self._condition.notify_all()
+                    return True
+                elif not self._condition.wait_for(
+                    lambda: len(self._queue) < self.maxsize or self._closed,
+                    self.block_timeout,
+                ):
+                    self.dropped += 1
+                    return False
+
+            self._queue.append(event)
+            self._condition.notify_all()
+        return True
+
+    def close(self, timeout=None, drain=True):
+        with self._condition:
+            self._closed = True
+            if not drain:
+                self._discard = True
+                self.dropped += len(self._queue)
+                self._queue.clear()
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def _spill(self, event):
+        if self._spill_file is None:
+            self._spill_file = open(self.spill_path, "a", encoding="UTF-8")
+        self._spill_file.write(json.dumps(event) + "\n")
+        self._spilling = True
+        self.spilled += 1
+
+    def _take_spill(self):
+        self._spill_file.close()
+        self._spill_file = None
+        draining = f"{self.spill_path}.draining"
+        os.replace(self.spill_path, draining)
+        return draining
+
+    def _run(self):
+        while True:
+            batch = None
+            draining = None
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._queue or self._spilling or self._closed
+                )
+                if self._discard:
+                    self._discard_spill()
+                    return
+                if self._queue:
+                    batch = list(self._queue)
+                    self._queue.clear()
+                    self._condition.notify_all()
+                elif self._spill_file is not None:
+                    draining = self._take_spill()
+                elif self._spilling:
+                    self._spilling = False
+                    continue
+                else:
+                    return
+
+            if batch is not None:
+                self._deliver(batch)
+            else:
+                with open(draining, encoding="UTF-8") as file:
+                    self._deliver(map(json.loads, file))
+                os.remove(draining)
+
+    def _discard_spill(self):
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+            os.remove(self.spill_path)
+
+    def _deliver(self, events):
+        for event in events:
+            if self._discard:
+                return
+            try:
+                self.callback(event)
+            except Exception:
+                self.errors += 1
+            else:
+                self.delivered += 1
+
+
+class EventBus:
+    def __init__(self, make_event=transaction_event):
+        self.make_event = make_event
+        self._subscriptions = ()
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback, **options):
+        subscription = Subscription(callback, **options)
+        with self._lock:
+            self._subscriptions += (subscription,)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions = tuple(
+                item
+                for item in self._subscriptions
+                if item is not subscription
+            )
+        subscription.close()
+
+    def publish(self, event):
+        for subscription in self._subscriptions:
+            subscription.offer(event)
+
+    def attach(self):
+        core.transaction_listeners.append(self)
+        return self
+
+    def detach(self):
+        core.transaction_listeners.remove(self)
+
+    def __call__(self, account, entry):
+        self.publish(self.make_event(account, entry))
+
+    def close(self, timeout=None, drain=True):
+        for subscription in self._subscriptions:
+            subscription.close(timeout, drain)
+        self._subscriptions = ()
+
+
+def benchmark(transactions=200_000):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    account = CheckingAccount.new_account(client, 1)
+    deposit = Deposit(100)
+
+    def slow(event):
+        time.sleep(0.0001)
+
+    def run():
+        start = time.perf_counter()
+        for _ in range(transactions):
+            deposit.commit(account)
+        return (time.perf_counter() - start) / transactions * 1e6
+
+    baseline = run()
+    print(f"Commit without bus: {baseline:.2f} us")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for policy in POLICIES:
+            bus = EventBus().attach()
+            subscription = bus.subscribe(
+                slow,
+                maxsize=1_000,
+                policy=policy,
+                spill_path=os.path.join(directory, "spill.jsonl"),
+                block_timeout=0.001,
+            )
+            observed = run()
+            bus.detach()
+            bus.close(drain=False)
+            print(
+                f"Commit with slow subscriber ({policy}): {observed:.2f} us, "
+                f"dropped {subscription.dropped:,}, "
+                f"spilled {subscription.spilled:,}"
+            )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,245 @@
+import csv
+import mmap
+import os
+import struct
+import tempfile
+import time
+import tracemalloc
+from array import array
+from datetime import datetime
+
+from .core import CheckingAccount, Deposit, Fee, Individual, Withdrawal
+
+CSV_FIELDS = ("branch", "number", "type", "amount", "date")
+
+MAGIC = b"BKCOLS01"
+CHUNK_HEADER = struct.Struct("<Q")
+COLUMNS = (
+    ("timestamp", "q"),
+    ("amount", "d"),
+    ("number", "q"),
+    ("branch", "H"),
+    ("type", "B"),
+)
+TYPE_CODES = {Deposit.__name__: 0, Withdrawal.__name__: 1, Fee.__name__: 2}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+
+
+def parse_date(date):
+    return datetime(
+        int(date[6:10]),
+        int(date[3:5]),
+        int(date[0:2]),
+        int(date[11:13]),
+        int(date[14:16]),
+        int(date[17:19]),
+    ).timestamp()
+
+
+def iter_rows(accounts):
+    for account in accounts:
+        branch = account.branch
+        number = account.number
+        for transaction in account.history.iter_transactions():
+            yield branch, number, transaction
+
+
+def export_csv(accounts, path):
+    rows = 0
+    with open(path, "w", newline="", encoding="UTF-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_FIELDS)
+        for branch, number, transaction in iter_rows(accounts):
+            writer.writerow(
+                (
+                    branch,
+                    number,
+                    transaction["type"],
+                    f"{transaction['amount']:.2f}",
+                    transaction["date"],
+                )
+            )
+            rows += 1
+    return rows
+
+
+def export_account_csv(account, path):
+    return export_csv((account,), path)
+
+
+class ColumnarWriter:
+    def __init__(self, file, chunk_rows=65_536):
+        self.file = file
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self._columns = {name: array(code) for name, code in COLUMNS}
+        self._last_date = None
+        self._last_timestamp = 0
+        file.write(MAGIC)
+
+    def append(self, branch, number, transaction):
+        date = transaction["date"]
+        if date != self._last_date:
+            self._last_date = date
+            self._last_timestamp = int(parse_date(date))
+
+        columns = self._columns
+        columns["timestamp"].append(self._last_timestamp)
+        columns["amount"].append(transaction["amount"])
+        columns["number"].append(number)
+        columns["branch"].append(int(branch))
+        columns["type"].append(TYPE_CODES[transaction["type"]])
+
+        if len(columns["type"]) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self):
+        rows = len(self._columns["type"])
+        if not rows:
+            return
+
+        self.file.write(CHUNK_HEADER.pack(rows))
+        for name, _ in COLUMNS:
+            column = self._columns[name]
+            column.tofile(self.file)
+            self.file.write(bytes(-column.itemsize * rows % 8))
+            del column[:]
+        self.rows += rows
+
+    def close(self):
+        self.flush()
+
+
+def export_columnar(accounts, path, chunk_rows=65_536):
+    with open(path, "wb") as file:
+        writer = ColumnarWriter(file, chunk_rows)
+        for row in iter_rows(accounts):
+            writer.append(*row)
+        writer.close()
+    return writer.rows
+
+
+def export_account_columnar(account, path, chunk_rows=65_536):
+    return export_columnar((account,), path, chunk_rows)
+
+
+class ColumnarReader:
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+        self._view = None
+        self._columns = []
+
+    def __enter__(self):
+        with open(self.path, "rb") as file:
+            if os.fstat(file.fileno()).st_size > len(MAGIC):
+                self._data = mmap.mmap(
+                    file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            else:
+                return self
+
+        if self._data[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a columnar statement file.")
+        self._view = memoryview(self._data)
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+    def __iter__(self):
+        data = self._data
+        if data is None:
+            return
+
+        offset = len(MAGIC)
+        while offset < len(data):
+            (rows,) = CHUNK_HEADER.unpack_from(data, offset)
+            offset += CHUNK_HEADER.size
+
+            chunk = {}
+            for name, code in COLUMNS:
+                size = struct.calcsize(code) * rows
+                chunk[name] = self._view[offset : offset + size].cast(code)
+                self._columns.append(chunk[name])
+                offset += size + (-size % 8)
+            yield chunk
+
+    def close(self):
+        for column in self._columns:
+            column.release()
+        self._columns.clear()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._data is not None:
+            try:
+                self._data.close()
+            except BufferError:
+                pass
+            self._data = None
+
+
+def read_columnar(path):
+    with ColumnarReader(path) as reader:
+        for chunk in reader:
+            yield {
+                name: array(code, chunk[name]) for name, code in COLUMNS
+            }
+
+
+def read_transactions(path):
+    with ColumnarReader(path) as reader:
+        for chunk in reader:
+            for timestamp, amount, number, branch, kind in zip(
+                chunk["timestamp"],
+                chunk["amount"],
+                chunk["number"],
+                chunk["branch"],
+                chunk["type"],
+            ):
+                yield (
+                    f"{branch:04d}",
+                    number,
+                    {
+                        "type": TYPE_NAMES[kind],
+                        "amount": amount,
+                        "date": datetime.fromtimestamp(timestamp).strftime(
+                            "%d-%m-%Y %H:%M:%S"
+                        ),
+                    },
+                )
+
+
+def benchmark(accounts=50_000, transactions=40):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    deposit = Deposit(100)
+    bank = []
+    for number in range(1, accounts + 1):
+        account = CheckingAccount.new_account(client, number)
+        for _ in range(transactions):
+            account.history.add_transaction(deposit)
+        bank.append(account)
+    rows = accounts * transactions
+
+    with tempfile.TemporaryDirectory() as directory:
+        exports = (("CSV", export_csv), ("Columnar", export_columnar))
+        for name, export in exports:
+            path = os.path.join(directory, name)
+            tracemalloc.start()
+            start = time.perf_counter()
+            export(bank, path)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"{name}: {rows / elapsed:,.0f} rows/s, "
+                f"{os.path.getsize(path) / rows:.1f} bytes/row, "
+                f"peak memory {peak / 1024:,.0f} KiB"
+            )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,99 @@
+import threading
+import time
+from collections import OrderedDict
+
+EXPIRES, PENDING, RESULT = range(3)
+_FAILED = object()
+
+
+class DedupeTable:
+    def __init__(self, ttl=24 * 60 * 60, max_entries=1_000_000, clock=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock or time.monotonic
+        self.hits = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            self._evict(self.clock())
+            return key in self._entries
+
+    def run(self, key, operation):
+        with self._lock:
+            while True:
+                now = self.clock()
+                self._evict(now)
+                entry = self._entries.get(key)
+                if entry is None:
+                    entry = self._entries[key] = [now + self.ttl, True, None]
+                    break
+                while entry[PENDING]:
+                    self._done.wait()
+                if entry[RESULT] is not _FAILED:
+                    self.hits += 1
+                    return entry[RESULT]
+
+        try:
+            entry[RESULT] = operation()
+        except BaseException:
+            with self._lock:
+                entry[RESULT] = _FAILED
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            raise
+        finally:
+            with self._done:
+                entry[PENDING] = False
+                self._done.notify_all()
+
+        return entry[RESULT]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self, now):
+        entries = self._entries
+        while entries:
+            key, entry = next(iter(entries.items()))
+            if entry[EXPIRES] > now and len(entries) < self.max_entries:
+                break
+            if entry[PENDING] and entry[EXPIRES] > now:
+                break
+            del entries[key]
+
+
+def _load(table, operations):
+    for number in range(operations):
+        table.run(number, int)
+        if number % 10 == 0:
+            table.run(number, int)
+
+
+def benchmark(operations=2_000_000, max_entries=100_000):
+    import tracemalloc
+
+    table = DedupeTable(max_entries=max_entries)
+    start = time.perf_counter()
+    _load(table, operations)
+    elapsed = time.perf_counter() - start
+
+    print(f"Throughput: {operations / elapsed:,.0f} keys/s")
+    print(f"Replays answered: {table.hits:,}")
+    print(f"Entries kept: {len(table):,} (max {max_entries:,})")
+
+    tracemalloc.start()
+    _load(table, operations)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Peak memory under sustained load: {peak / 1024 / 1024:,.1f} MiB")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,159 @@
+import csv
+import os
+import tempfile
+import time
+from itertools import islice
+
+from .core import DEFAULT_BRANCH, CheckingAccount, Individual
+from .validation import BIRTH_DATE_PATTERN, cpf_errors, generate_cpf
+
+FIELDS = ("cpf", "name", "birth_date", "address", "account")
+
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.clients = 0
+        self.accounts = 0
+        self.rejected = []
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def reject(self, line, row, reason):
+        self.rejected.append((line, row, reason))
+
+    def __str__(self):
+        return (
+            f"Rows read: {self.rows}\n"
+            f"Clients created: {self.clients}\n"
+            f"Accounts created: {self.accounts}\n"
+            f"Rows rejected: {len(self.rejected)}\n"
+            f"Throughput: {self.rows_per_second:,.0f} rows/s"
+        )
+
+
+def validate_rows(rows):
+    birth_date_match = BIRTH_DATE_PATTERN.fullmatch
+    cpfs = cpf_errors(row["cpf"] or "" for row in rows)
+
+    errors = []
+    for row, cpf_error in zip(rows, cpfs):
+        if None in row or None in row.values():
+            errors.append("Wrong number of columns.")
+        elif cpf_error:
+            errors.append(f"Invalid CPF. {cpf_error}")
+        elif not birth_date_match(row["birth_date"]):
+            errors.append("Invalid Birth Date.")
+        elif not row["name"]:
+            errors.append("Missing name.")
+        elif row["account"] and not (
+            row["account"].isascii() and row["account"].isdigit()
+        ):
+            errors.append("Invalid account number.")
+        else:
+            errors.append(None)
+    return errors
+
+
+def import_csv(path, clients, accounts, batch_size=10_000, rejects_path=None):
+    report = ImportReport()
+    clients_by_cpf = {client.cpf: client for client in clients}
+    numbers = {(account.branch, account.number) for account in accounts}
+
+    start = time.perf_counter()
+    with open(path, newline="", encoding="UTF-8") as file:
+        reader = csv.DictReader(file)
+        if missing := set(FIELDS) - set(reader.fieldnames or ()):
+            raise ValueError(f"Missing CSV columns: {sorted(missing)}")
+
+        line = 1
+        while batch := list(islice(reader, batch_size)):
+            new_clients = []
+            new_accounts = []
+
+            for row, error in zip(batch, validate_rows(batch)):
+                line += 1
+                if error:
+                    report.reject(line, row, error)
+                    continue
+
+                key = None
+                if row["account"]:
+                    key = (DEFAULT_BRANCH, int(row["account"]))
+                    if key in numbers:
+                        report.reject(line, row, "Duplicate account number.")
+                        continue
+
+                client = clients_by_cpf.get(row["cpf"])
+                if not client:
+                    client = Individual(
+                        name=row["name"],
+                        birth_date=row["birth_date"],
+                        cpf=row["cpf"],
+                        address=row["address"],
+                    )
+                    clients_by_cpf[client.cpf] = client
+                    new_clients.append(client)
+
+                if key is None:
+                    continue
+
+                account = CheckingAccount.new_account(
+                    client=client, number=key[1]
+                )
+                numbers.add(key)
+                client.add_account(account)
+                new_accounts.append(account)
+
+            clients.extend(new_clients)
+            accounts.extend(new_accounts)
+            report.rows += len(batch)
+            report.clients += len(new_clients)
+            report.accounts += len(new_accounts)
+
+    report.elapsed = time.perf_counter() - start
+
+    if rejects_path and report.rejected:
+        write_rejects(rejects_path, report.rejected)
+
+    return report
+
+
+def write_rejects(path, rejected):
+    with open(path, "w", newline="", encoding="UTF-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(("line", *FIELDS, "reason"))
+        for line, row, reason in rejected:
+            writer.writerow(
+                (line, *(row.get(field) or "" for field in FIELDS), reason)
+            )
+
+
+def benchmark(rows=200_000, batch_size=10_000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "clients.csv")
+        with open(path, "w", newline="", encoding="UTF-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(FIELDS)
+            for number in range(1, rows + 1):
+                writer.writerow(
+                    (
+                        generate_cpf(),
+                        f"Client {number}",
+                        "01-01-1990",
+                        "Street, 1 - Center - City/ST",
+                        number,
+                    )
+                )
+
+        report = import_csv(path, [], [], batch_size=batch_size)
+
+    print(report)
+    return report
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,225 @@
+import time
+from collections import deque
+from datetime import datetime
+
+TRANSACTION = "transaction"
+UNCAPPED_KINDS = frozenset({"Fee"})
+
+
+class AmountCap:
+    __slots__ = ("max_amount", "message")
+
+    def __init__(self, max_amount, message):
+        self.max_amount = max_amount
+        self.message = message
+
+    def allows(self, amount, now):
+        return amount <= self.max_amount
+
+    def record(self, amount, now):
+        pass
+
+    def expire(self, now):
+        pass
+
+    def reset(self):
+        pass
+
+    def copy(self):
+        return self
+
+
+class FixedDayWindow:
+    __slots__ = ("max_count", "message", "_day", "_count")
+
+    def __init__(self, max_count, message):
+        self.max_count = max_count
+        self.message = message
+        self._day = None
+        self._count = 0
+
+    def allows(self, amount, now):
+        if self._day != now.toordinal():
+            return self.max_count > 0
+        return self._count < self.max_count
+
+    def record(self, amount, now):
+        day = now.toordinal()
+        if self._day != day:
+            self._day = day
+            self._count = 0
+        self._count += 1
+
+    def expire(self, now):
+        if self._day is not None and self._day < now.toordinal():
+            self.reset()
+
+    def reset(self):
+        self._day = None
+        self._count = 0
+
+    def copy(self):
+        rule = FixedDayWindow(self.max_count, self.message)
+        rule._day = self._day
+        rule._count = self._count
+        return rule
+
+
+class DailyAmountCap:
+    __slots__ = ("max_amount", "message", "_day", "_total")
+
+    def __init__(self, max_amount, message):
+        self.max_amount = max_amount
+        self.message = message
+        self._day = None
+        self._total = 0
+
+    def allows(self, amount, now):
+        total = self._total if self._day == now.toordinal() else 0
+        return total + amount <= self.max_amount
+
+    def record(self, amount, now):
+        day = now.toordinal()
+        if self._day != day:
+            self._day = day
+            self._total = 0
+        self._total += amount
+
+    def expire(self, now):
+        if self._day is not None and self._day < now.toordinal():
+            self.reset()
+
+    def reset(self):
+        self._day = None
+        self._total = 0
+
+    def copy(self):
+        rule = DailyAmountCap(self.max_amount, self.message)
+        rule._day = self._day
+        rule._total = self._total
+        return rule
+
+
+class RollingWindow:
+    __slots__ = ("max_count", "seconds", "message", "_events")
+
+    def __init__(self, max_count, message, seconds=24 * 60 * 60):
+        self.max_count = max_count
+        self.seconds = seconds
+        self.message = message
+        self._events = deque(maxlen=max_count)
+
+    def allows(self, amount, now):
+        events = self._events
+        if len(events) < self.max_count:
+            return True
+        if not events:
+            return False
+        return now.timestamp() - events[0] >= self.seconds
+
+    def record(self, amount, now):
+        self._events.append(now.timestamp())
+
+    def expire(self, now):
+        events = self._events
+        cutoff = now.timestamp() - self.seconds
+        while events and events[0] <= cutoff:
+            events.popleft()
+
+    def reset(self):
+        self._events.clear()
+
+    def copy(self):
+        rule = RollingWindow(self.max_count, self.message, self.seconds)
+        rule._events.extend(self._events)
+        return rule
+
+
+class AccountLimits:
+    __slots__ = ("_rules",)
+
+    def __init__(self, rules):
+        self._rules = {kind: tuple(items) for kind, items in rules.items()}
+
+    @property
+    def rules(self):
+        return self._rules
+
+    def check(self, kind, amount, now=None):
+        rules = self._rules.get(kind)
+        if not rules:
+            return None
+
+        now = now or datetime.now()
+        for rule in rules:
+            if not rule.allows(amount, now):
+                return rule.message
+        return None
+
+    def check_transaction(self, kind, amount, now=None):
+        if kind in UNCAPPED_KINDS:
+            return None
+        return self.check(TRANSACTION, amount, now)
+
+    def record(self, kind, amount, now=None):
+        now = now or datetime.now()
+        if kind not in UNCAPPED_KINDS:
+            for rule in self._rules.get(TRANSACTION, ()):
+                rule.record(amount, now)
+        if kind != TRANSACTION:
+            for rule in self._rules.get(kind, ()):
+                rule.record(amount, now)
+
+    def expire(self, now=None):
+        now = now or datetime.now()
+        for rules in self._rules.values():
+            for rule in rules:
+                rule.expire(now)
+
+    def reset(self):
+        for rules in self._rules.values():
+            for rule in rules:
+                rule.reset()
+
+    def copy(self):
+        return AccountLimits(
+            {
+                kind: [rule.copy() for rule in rules]
+                for kind, rules in self._rules.items()
+            }
+        )
+
+
+def benchmark(accounts=1_000_000, operations=2_000_000):
+    from random import randrange
+
+    limits = [
+        AccountLimits(
+            {
+                TRANSACTION: [FixedDayWindow(10, "Daily cap.")],
+                "Withdrawal": [
+                    AmountCap(500, "Amount cap."),
+                    RollingWindow(3, "Rolling cap."),
+                ],
+            }
+        )
+        for _ in range(accounts)
+    ]
+
+    now = datetime.now()
+    start = time.perf_counter()
+    for _ in range(operations):
+        account_limits = limits[randrange(accounts)]
+        if not (
+            account_limits.check(TRANSACTION, 100, now)
+            or account_limits.check("Withdrawal", 100, now)
+        ):
+            account_limits.record("Withdrawal", 100, now)
+    elapsed = time.perf_counter() - start
+
+    print(f"Checked {operations:,} operations over {accounts:,} accounts")
+    print(f"Throughput: {operations / elapsed:,.0f} checks/s")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,87 @@
+import heapq
+import time
+import tracemalloc
+
+from .core import CheckingAccount, Individual
+
+
+def sort_key(account):
+    return account.branch, account.number
+
+
+class Page:
+    def __init__(self, accounts, cursor):
+        self.accounts = accounts
+        self.cursor = cursor
+
+    def __len__(self):
+        return len(self.accounts)
+
+    def __iter__(self):
+        return iter(self.accounts)
+
+    def __str__(self):
+        return "\n".join("=" * 50 + "\n" + str(account) for account in self)
+
+
+def page(accounts, cursor=None, page_size=50, client=None):
+    candidates = (
+        account
+        for account in accounts
+        if (cursor is None or sort_key(account) > cursor)
+        and (client is None or account.client is client)
+    )
+    chosen = heapq.nsmallest(page_size + 1, candidates, key=sort_key)
+    if len(chosen) > page_size:
+        return Page(chosen[:page_size], sort_key(chosen[page_size - 1]))
+    return Page(chosen, None)
+
+
+def iter_pages(fetch, page_size=50, client=None):
+    cursor = None
+    while True:
+        current = fetch(cursor, page_size, client)
+        yield current
+        if current.cursor is None:
+            return
+        cursor = current.cursor
+
+
+def benchmark(accounts=1_000_000, pages=200, page_size=50):
+    from .branches import Bank
+
+    bank = Bank()
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    for index in range(accounts):
+        bank.add_account(
+            CheckingAccount(
+                index // 4 + 1, client, branch=f"{index % 4 + 1:04d}"
+            )
+        )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    for current, _ in zip(iter_pages(bank.page, page_size), range(pages)):
+        str(current)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"Paged listing: {elapsed / pages * 1000:.2f} ms per page of "
+        f"{page_size}, peak {peak / 1024:,.0f} KiB"
+    )
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    str(Page(list(bank.accounts()), None))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"Single string of {accounts:,} accounts: {elapsed:.2f}s, "
+        f"peak {peak / 1024 / 1024:,.0f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    benchmark()
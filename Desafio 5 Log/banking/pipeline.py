@@ -0,0 +1,245 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import redirect_stdout
+from random import Random
+
+from .branches import Bank
+from .core import (
+    DEFAULT_BRANCH,
+    CheckingAccount,
+    Deposit,
+    Individual,
+    Withdrawal,
+)
+
+
+class CommandRing:
+    def __init__(self, capacity=4_096):
+        self.capacity = capacity
+        self._slots = [None] * capacity
+        self._head = 0
+        self._tail = 0
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._draining = False
+        self._blocked = 0
+        self.closed = False
+
+    def __len__(self):
+        return self._tail - self._head
+
+    def put(self, command):
+        with self._not_full:
+            while not self.closed and self._tail - self._head == self.capacity:
+                self._blocked += 1
+                self._not_full.wait()
+                self._blocked -= 1
+            if self.closed:
+                raise RuntimeError("Command pipeline is closed.")
+            self._slots[self._tail % self.capacity] = command
+            self._tail += 1
+            if self._draining:
+                self._draining = False
+                self._not_empty.notify()
+
+    def drain(self):
+        with self._not_empty:
+            while not self.closed and self._tail == self._head:
+                self._draining = True
+                self._not_empty.wait()
+
+            slots = self._slots
+            commands = []
+            for index in range(self._head, self._tail):
+                position = index % self.capacity
+                commands.append(slots[position])
+                slots[position] = None
+            self._head = self._tail
+            if self._blocked:
+                self._not_full.notify_all()
+        return commands
+
+    def close(self):
+        with self._lock:
+            self.closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+
+
+def _deposit(account, amount):
+    return account.client.perform_transaction(account, Deposit(amount))
+
+
+def _withdraw(account, amount):
+    return account.client.perform_transaction(account, Withdrawal(amount))
+
+
+def _apply_batch(commands):
+    results = []
+    for operation, *args in commands:
+        try:
+            results.append(operation(*args))
+        except Exception as error:
+            results.append(error)
+    return results
+
+
+class CommandPipeline:
+    def __init__(self, bank, capacity=4_096):
+        self.bank = bank
+        self.applied = 0
+        self._ring = CommandRing(capacity)
+        self._writer = threading.Thread(
+            target=self._run, name="command-writer", daemon=True
+        )
+        self._writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+        return False
+
+    def submit(self, operation, *args):
+        future = Future()
+        self._ring.put((operation, args, future))
+        return future
+
+    def submit_batch(self, commands):
+        return self.submit(_apply_batch, commands)
+
+    def deposit(self, account, amount):
+        return self.submit(_deposit, account, amount)
+
+    def withdraw(self, account, amount):
+        return self.submit(_withdraw, account, amount)
+
+    def create_client(self, client):
+        return self.submit(self.bank.add_client, client)
+
+    def create_account(self, client, branch=DEFAULT_BRANCH, **options):
+        return self.submit(
+            lambda: self.bank.open_account(client, branch, **options)
+        )
+
+    def _run(self):
+        pending = deque()
+        try:
+            while pending := deque(self._ring.drain()):
+                while pending:
+                    operation, args, future = pending.popleft()
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        result = operation(*args)
+                    except Exception as error:
+                        future.set_exception(error)
+                    else:
+                        future.set_result(result)
+                    self.applied += 1
+        finally:
+            self._ring.close()
+            for _, _, future in [*pending, *self._ring.drain()]:
+                if future.set_running_or_notify_cancel():
+                    future.set_exception(
+                        RuntimeError("Command pipeline writer stopped.")
+                    )
+
+    def close(self):
+        self._ring.close()
+        self._writer.join()
+
+
+def benchmark(accounts=1_000, producers=8, operations=20_000, batch=64):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    rng = Random(1)
+    weights = [1 / rank**1.2 for rank in range(1, accounts + 1)]
+    workloads = [
+        rng.choices(range(accounts), weights=weights, k=operations)
+        for _ in range(producers)
+    ]
+
+    def open_accounts():
+        bank = []
+        for number in range(1, accounts + 1):
+            account = CheckingAccount(number, client)
+            account.daily_transaction_limit = producers * operations
+            bank.append(account)
+        return bank
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        bank = open_accounts()
+        locks = [threading.Lock() for _ in bank]
+
+        def locked(indexes):
+            for index in indexes:
+                with locks[index]:
+                    _deposit(bank[index], 1)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(producers) as pool:
+            list(pool.map(locked, workloads))
+        with_locks = time.perf_counter() - start
+
+        ring_bank = open_accounts()
+        with CommandPipeline(Bank()) as pipeline:
+
+            def pipelined(indexes):
+                futures = [
+                    pipeline.deposit(ring_bank[index], 1) for index in indexes
+                ]
+                for future in futures:
+                    future.result()
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(producers) as pool:
+                list(pool.map(pipelined, workloads))
+            with_pipeline = time.perf_counter() - start
+
+        batch_bank = open_accounts()
+        with CommandPipeline(Bank()) as pipeline:
+
+            def batched(indexes):
+                futures = [
+                    pipeline.submit_batch(
+                        [
+                            (_deposit, batch_bank[index], 1)
+                            for index in indexes[offset : offset + batch]
+                        ]
+                    )
+                    for offset in range(0, len(indexes), batch)
+                ]
+                for future in futures:
+                    future.result()
+
+            start = time.perf_counter()
+            with ThreadPoolExecutor(producers) as pool:
+                list(pool.map(batched, workloads))
+            with_batches = time.perf_counter() - start
+
+    total = producers * operations
+    print(
+        f"{producers} producers, {total:,} deposits over {accounts:,} "
+        "Zipf-skewed accounts"
+    )
+    print(f"Per-account locks: {total / with_locks:,.0f} operations/s")
+    print(f"Ring-buffer writer: {total / with_pipeline:,.0f} operations/s")
+    print(
+        f"Ring-buffer writer, batches of {batch}: "
+        f"{total / with_batches:,.0f} operations/s"
+    )
+    balances = [account.balance for account in bank]
+    matches = all(
+        balances == [account.balance for account in pipelined_bank]
+        for pipelined_bank in (ring_bank, batch_bank)
+    )
+    print(f"Balances match: {matches}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,303 @@
+import os
+import tempfile
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from datetime import datetime
+from functools import lru_cache
+from itertools import compress
+from math import fsum, isclose
+
+from .core import (
+    Account,
+    CheckingAccount,
+    Deposit,
+    Fee,
+    Individual,
+    Withdrawal,
+)
+from .export import TYPE_CODES
+from .limits import UNCAPPED_KINDS
+from .snapshot import Snapshot, read_snapshot, write_snapshot
+
+TOLERANCE = 0.005
+QUARTER_HOUR = 15 * 60
+
+
+def _selector(*kinds):
+    table = bytearray(256)
+    for kind in kinds:
+        table[TYPE_CODES[kind]] = 1
+    return bytes(table)
+
+
+CREDITS = _selector(Deposit.__name__)
+DEBITS = _selector(Withdrawal.__name__, Fee.__name__)
+WITHDRAWALS = _selector(Withdrawal.__name__)
+CAPPED = _selector(
+    *(kind for kind in TYPE_CODES if kind not in UNCAPPED_KINDS)
+)
+
+
+@lru_cache(maxsize=None)
+def _quarter_day(quarter):
+    return datetime.fromtimestamp(quarter * QUARTER_HOUR).toordinal()
+
+
+def _day(timestamp):
+    return _quarter_day(timestamp // QUARTER_HOUR)
+
+
+def _busiest_day(days):
+    day, count = Counter(days).most_common(1)[0]
+    return datetime.fromordinal(day).strftime("%d-%m-%Y"), count
+
+
+def reconcile_range(snapshot, start, stop, daily_limit):
+    columns = snapshot.columns
+    ends = columns["history_end"]
+    first = ends[start - 1] if start else 0
+    last = ends[stop - 1] if stop > start else first
+
+    types = bytes(columns["type"][first:last])
+    credits = types.translate(CREDITS)
+    debits = types.translate(DEBITS)
+    withdrawals = types.translate(WITHDRAWALS)
+    capped = types.translate(CAPPED)
+    amount = columns["amount"]
+    timestamp = columns["timestamp"]
+
+    discrepancies = []
+    begin = first
+    for index in range(start, stop):
+        end = ends[index]
+        account = columns["branch"][index], columns["number"][index]
+        amounts = amount[begin:end]
+        low, high = begin - first, end - first
+        withdrawn = withdrawals[low:high]
+        counted = capped[low:high]
+
+        expected = fsum(compress(amounts, credits[low:high])) - fsum(
+            compress(amounts, debits[low:high])
+        )
+        balance = columns["balance"][index]
+        if not isclose(balance, expected, rel_tol=0, abs_tol=TOLERANCE):
+            discrepancies.append(
+                (
+                    *account,
+                    f"Balance $ {balance:.2f} differs from history "
+                    f"$ {expected:.2f}.",
+                )
+            )
+
+        largest = max(compress(amounts, withdrawn), default=0)
+        if largest > columns["limit"][index]:
+            discrepancies.append(
+                (
+                    *account,
+                    f"Withdrawal of $ {largest:.2f} exceeds the limit of "
+                    f"$ {columns['limit'][index]:.2f}.",
+                )
+            )
+
+        withdrawal_limit = columns["withdrawal_limit"][index]
+        over_total = counted.count(1) > daily_limit
+        over_withdrawals = withdrawn.count(1) > withdrawal_limit
+        if over_total or over_withdrawals:
+            days = list(map(_day, timestamp[begin:end]))
+            if over_total:
+                day, count = _busiest_day(compress(days, counted))
+                if count > daily_limit:
+                    discrepancies.append(
+                        (
+                            *account,
+                            f"{count} transactions on {day} exceed the "
+                            f"daily cap of {daily_limit}.",
+                        )
+                    )
+            if over_withdrawals:
+                day, count = _busiest_day(compress(days, withdrawn))
+                if count > withdrawal_limit:
+                    discrepancies.append(
+                        (
+                            *account,
+                            f"{count} withdrawals on {day} exceed the "
+                            f"limit of {withdrawal_limit}.",
+                        )
+                    )
+        begin = end
+
+    return stop - start, last - first, discrepancies
+
+
+_snapshots = {}
+
+
+def reconcile_file(path, start, stop, daily_limit):
+    status = os.stat(path)
+    key = path, status.st_mtime_ns, status.st_size
+    snapshot = _snapshots.get(key)
+    if snapshot is None:
+        _snapshots.clear()
+        snapshot = _snapshots[key] = read_snapshot(path)
+    return reconcile_range(snapshot, start, stop, daily_limit)
+
+
+class ReconciliationReport:
+    def __init__(self, source):
+        self.source = source
+        self.accounts = 0
+        self.transactions = 0
+        self.discrepancies = []
+        self.elapsed = 0.0
+
+    @property
+    def balanced(self):
+        return not self.discrepancies
+
+    @property
+    def accounts_per_second(self):
+        return self.accounts / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return self.summary()
+
+    def summary(self, shown=20):
+        lines = [
+            f"Reconciliation of {self.source}: {self.accounts:,} accounts, "
+            f"{self.transactions:,} transactions in {self.elapsed:.2f}s "
+            f"({self.accounts_per_second:,.0f} accounts/s), "
+            f"{len(self.discrepancies):,} discrepancies"
+        ]
+        lines += [
+            f"  Agency {branch:04d} account {number}: {message}"
+            for branch, number, message in self.discrepancies[:shown]
+        ]
+        if len(self.discrepancies) > shown:
+            lines.append(f"  ... {len(self.discrepancies) - shown:,} more")
+        return "\n".join(lines)
+
+
+class Reconciliation:
+    def __init__(self, chunk_size=50_000, max_workers=None, daily_limit=None):
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.daily_limit = (
+            Account.daily_transaction_limit
+            if daily_limit is None
+            else daily_limit
+        )
+
+    def run(self, accounts, executor=None):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "reconciliation.snapshot")
+            write_snapshot(Snapshot.from_accounts(accounts), path)
+            report = self.run_snapshot(path, executor)
+        report.source = "accounts"
+        return report
+
+    def run_snapshot(self, path, executor=None):
+        report = ReconciliationReport(path)
+        start = time.perf_counter()
+
+        if executor is None:
+            with ProcessPoolExecutor(self.max_workers) as pool:
+                self._run(pool, path, report)
+        else:
+            self._run(executor, path, report)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _run(self, executor, path, report):
+        snapshot = read_snapshot(path)
+        total = len(snapshot)
+        del snapshot
+
+        pending = deque(
+            executor.submit(
+                reconcile_file,
+                path,
+                start,
+                min(start + self.chunk_size, total),
+                self.daily_limit,
+            )
+            for start in range(0, total, self.chunk_size)
+        )
+        while pending:
+            accounts, transactions, discrepancies = pending.popleft().result()
+            report.accounts += accounts
+            report.transactions += transactions
+            report.discrepancies += discrepancies
+
+
+def _walk_history(accounts, daily_limit=Account.daily_transaction_limit):
+    discrepancies = []
+    for account in accounts:
+        expected = 0.0
+        days = Counter()
+        withdrawals = Counter()
+        for entry in account.history.iter_transactions():
+            day = entry["date"][:10]
+            if entry["type"] not in UNCAPPED_KINDS:
+                days[day] += 1
+            if entry["type"] == Deposit.__name__:
+                expected += entry["amount"]
+            else:
+                expected -= entry["amount"]
+            if entry["type"] == Withdrawal.__name__:
+                withdrawals[day] += 1
+                if entry["amount"] > account._limit:
+                    discrepancies.append(account)
+        if abs(account.balance - expected) > TOLERANCE:
+            discrepancies.append(account)
+        if any(count > daily_limit for count in days.values()):
+            discrepancies.append(account)
+        if any(
+            count > account._withdrawal_limit
+            for count in withdrawals.values()
+        ):
+            discrepancies.append(account)
+    return discrepancies
+
+
+def benchmark(accounts=100_000, transactions=10, planted=100):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    operations = (Deposit(100), Withdrawal(40), Fee(1.5))
+    bank = []
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for number in range(1, accounts + 1):
+            account = CheckingAccount.new_account(client, number)
+            for index in range(transactions):
+                operations[index % 3].record(account)
+            bank.append(account)
+
+    step = accounts // planted
+    for account in bank[::step]:
+        account._balance += 10
+    for account in bank[step // 2 :: step]:
+        account.history.add_transaction(Withdrawal(600))
+
+    start = time.perf_counter()
+    found = len(_walk_history(bank))
+    elapsed = time.perf_counter() - start
+    print(
+        f"Walking history objects: {accounts / elapsed:,.0f} accounts/s, "
+        f"{found} discrepancies"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bank.snapshot")
+        start = time.perf_counter()
+        write_snapshot(Snapshot.from_accounts(bank), path)
+        print(f"Snapshot written in {time.perf_counter() - start:.2f}s")
+
+        for workers in sorted({1, os.cpu_count() or 1}):
+            report = Reconciliation(max_workers=workers).run_snapshot(path)
+            print(f"{workers} worker(s)")
+            print(report.summary(shown=3))
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,363 @@
+import os
+import struct
+import tempfile
+import time
+import zlib
+from bisect import bisect_right
+from datetime import datetime
+
+from .core import (
+    CheckingAccount,
+    Deposit,
+    History,
+    HistorySnapshot,
+    Individual,
+    Withdrawal,
+)
+from .export import TYPE_CODES, TYPE_NAMES, parse_date
+
+DATE_FORMAT = "%d-%m-%Y %H:%M:%S"
+RAW_AMOUNT = 0x80
+DOUBLE = struct.Struct("<d")
+
+
+def zigzag(value):
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def write_varint(buffer, value):
+    while value >= 0x80:
+        buffer.append(value & 0x7F | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, offset):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def encode_segment(transactions):
+    buffer = bytearray()
+    write_varint(buffer, len(transactions))
+    previous = 0
+    for transaction in transactions:
+        timestamp = int(parse_date(transaction["date"]))
+        amount = transaction["amount"]
+        cents = round(amount * 100)
+        exact = cents / 100 == amount
+        code = TYPE_CODES[transaction["type"]]
+        buffer.append(code if exact else code | RAW_AMOUNT)
+        write_varint(buffer, zigzag(timestamp - previous))
+        if exact:
+            write_varint(buffer, zigzag(cents))
+        else:
+            buffer += DOUBLE.pack(amount)
+        previous = timestamp
+    return zlib.compress(bytes(buffer))
+
+
+def decode_segment(payload):
+    data = zlib.decompress(payload)
+    count, offset = read_varint(data, 0)
+    timestamp = 0
+    last_timestamp = None
+    date = None
+    for _ in range(count):
+        code = data[offset]
+        delta, offset = read_varint(data, offset + 1)
+        if code & RAW_AMOUNT:
+            (amount,) = DOUBLE.unpack_from(data, offset)
+            offset += DOUBLE.size
+        else:
+            cents, offset = read_varint(data, offset)
+            amount = unzigzag(cents) / 100
+        timestamp += unzigzag(delta)
+        if timestamp != last_timestamp:
+            last_timestamp = timestamp
+            date = datetime.fromtimestamp(timestamp).strftime(DATE_FORMAT)
+        yield {
+            "type": TYPE_NAMES[code & ~RAW_AMOUNT],
+            "amount": amount,
+            "date": date,
+        }
+
+
+def segment_length(payload):
+    return read_varint(zlib.decompressobj().decompress(payload, 10), 0)[0]
+
+
+class RetentionPolicy:
+    def __init__(self, directory, hot_size=1_000, segment_size=None):
+        self.directory = directory
+        self.hot_size = hot_size
+        self.segment_size = segment_size or hot_size
+
+    def account_directory(self, branch, number):
+        return os.path.join(self.directory, f"{branch}-{number}")
+
+    def apply(self, account):
+        history = account.history
+        if isinstance(history, TieredHistory):
+            return history
+
+        account._history = TieredHistory(
+            self,
+            self.account_directory(account.branch, account.number),
+            history.iter_transactions(),
+        )
+        return account._history
+
+
+class TieredTransactions:
+    __slots__ = ("_history",)
+
+    def __init__(self, history):
+        self._history = history
+
+    def __len__(self):
+        return self._history.count
+
+    def __iter__(self):
+        return self._history.iter_transactions()
+
+    def __reversed__(self):
+        history = self._history
+        yield from reversed(history.hot_transactions)
+        for index in reversed(range(history.segments)):
+            yield from reversed(list(history.read_segment(index)))
+
+    def __getitem__(self, index):
+        history = self._history
+        cold = history.cold
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            return history.entries(start, stop)
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("history index out of range")
+        if index >= cold:
+            return history.hot_transactions[index - cold]
+        return history.entries(index, index + 1)[0]
+
+    def append(self, entry):
+        self._history.append_entry(entry)
+
+    def extend(self, entries):
+        for entry in entries:
+            self._history.append_entry(entry)
+
+
+class TieredSnapshot:
+    __slots__ = ("_history", "_segments", "_cold", "_hot")
+
+    def __init__(self, history, segments, cold, hot):
+        self._history = history
+        self._segments = segments
+        self._cold = cold
+        self._hot = HistorySnapshot(hot)
+
+    def __len__(self):
+        return self._cold + len(self._hot)
+
+    def __iter__(self):
+        for index in range(self._segments):
+            yield from self._history.read_segment(index)
+        yield from self._hot
+
+    @property
+    def balance(self):
+        return self._hot.balance
+
+
+class TieredHistory(History):
+    def __init__(self, policy, directory, transactions=()):
+        super().__init__()
+        self._policy = policy
+        self._directory = directory
+        self._ends = []
+        self._reopen()
+        self._segments = len(self._ends)
+        self._cold = self._ends[-1] if self._ends else 0
+        self._transactions = self._unarchived(list(transactions))
+        self._view = (self._segments, self._cold, self._transactions)
+        self._compact()
+
+    @property
+    def transactions(self):
+        return TieredTransactions(self)
+
+    @property
+    def hot_transactions(self):
+        return self._transactions
+
+    @property
+    def segments(self):
+        return self._segments
+
+    @property
+    def cold(self):
+        return self._cold
+
+    @property
+    def count(self):
+        return self._cold + len(self._transactions)
+
+    def add_transaction(self, transaction, date=None, balance=None):
+        entry = super().add_transaction(transaction, date, balance)
+        self._compact_if_full()
+        return entry
+
+    def append_entry(self, entry):
+        self._transactions.append(entry)
+        self._compact_if_full()
+
+    def entries(self, start, stop):
+        ends = self._ends[: self._segments]
+        entries = []
+        index = bisect_right(ends, start)
+        while index < len(ends) and start < stop:
+            first = ends[index - 1] if index else 0
+            segment = list(self.read_segment(index))
+            entries += segment[start - first : stop - first]
+            start = ends[index]
+            index += 1
+        cold = self._cold
+        if stop > cold:
+            entries += self._transactions[max(start - cold, 0) : stop - cold]
+        return entries
+
+    def _reopen(self):
+        index = 0
+        while os.path.exists(path := self._segment_path(index)):
+            with open(path, "rb") as file:
+                length = segment_length(file.read())
+            self._ends.append((self._ends[-1] if self._ends else 0) + length)
+            index += 1
+
+    def _unarchived(self, transactions):
+        cold = self._ends[-1] if self._ends else 0
+        if not cold or not transactions:
+            return transactions
+        if len(transactions) < cold:
+            raise ValueError(
+                f"{self._directory} archives {cold} transactions but only "
+                f"{len(transactions)} were given; load the full history or "
+                "none of it before applying the retention policy."
+            )
+
+        *_, archived = self.read_segment(len(self._ends) - 1)
+        given = transactions[cold - 1]
+        if any(
+            archived[key] != given[key] for key in ("type", "amount", "date")
+        ):
+            raise ValueError(
+                f"{self._directory} does not match the account's history."
+            )
+        return transactions[cold:]
+
+    def _compact_if_full(self):
+        policy = self._policy
+        if len(self._transactions) >= policy.hot_size + policy.segment_size:
+            self._compact()
+
+    def iter_transactions(self):
+        return iter(self.snapshot())
+
+    def snapshot(self):
+        return TieredSnapshot(self, *self._view)
+
+    def read_segment(self, index):
+        with open(self._segment_path(index), "rb") as file:
+            payload = file.read()
+        return decode_segment(payload)
+
+    def _segment_path(self, index):
+        return os.path.join(self._directory, f"{index:08d}.seg")
+
+    def _compact(self):
+        policy = self._policy
+        transactions = self._transactions
+        segments = self._segments
+        moved = 0
+        while len(transactions) - moved >= (
+            policy.hot_size + policy.segment_size
+        ):
+            segment = transactions[moved : moved + policy.segment_size]
+            self._write_segment(segments, segment)
+            segments += 1
+            moved += len(segment)
+            self._ends.append(self._cold + moved)
+
+        if moved:
+            self._transactions = transactions[moved:]
+            self._segments = segments
+            self._cold += moved
+            self._view = (segments, self._cold, self._transactions)
+
+    def _write_segment(self, index, transactions):
+        os.makedirs(self._directory, exist_ok=True)
+        path = self._segment_path(index)
+        with open(f"{path}.tmp", "wb") as file:
+            file.write(encode_segment(transactions))
+        os.replace(f"{path}.tmp", path)
+
+
+def benchmark(transactions=200_000, hot_size=1_000):
+    import tracemalloc
+
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    operations = [
+        Withdrawal(index % 50 + 10) if index % 4 == 0 else Deposit(index + 0.5)
+        for index in range(1_000)
+    ]
+
+    with tempfile.TemporaryDirectory() as directory:
+        policy = RetentionPolicy(directory, hot_size=hot_size)
+        for name, tiered in (("In-memory History", False), ("Tiered", True)):
+            account = CheckingAccount.new_account(client, 1)
+            if tiered:
+                policy.apply(account)
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            for index in range(transactions):
+                account.history.add_transaction(operations[index % 1_000])
+            elapsed = time.perf_counter() - start
+            resident, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            start = time.perf_counter()
+            read = sum(1 for _ in account.history.iter_transactions())
+            scan = time.perf_counter() - start
+            print(
+                f"{name}: {transactions / elapsed:,.0f} appends/s, "
+                f"{resident / 1024 / 1024:,.1f} MiB resident, "
+                f"{read / scan:,.0f} reads/s"
+            )
+
+        disk = sum(
+            entry.stat().st_size
+            for entry in os.scandir(policy.account_directory("0001", 1))
+        )
+        cold = account.history.count - len(account.history.hot_transactions)
+        print(f"Cold segments: {disk / cold:.2f} bytes/row")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,245 @@
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from .core import Individual
+
+BUCKET_SIZE = 2
+
+
+def normalize(name):
+    if name.isascii():
+        return " ".join(name.casefold().split())
+
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(
+        char for char in decomposed if not unicodedata.combining(char)
+    )
+    return " ".join(stripped.casefold().split())
+
+
+def deletions(token):
+    variants = {
+        token[:index] + token[index + 1 :] for index in range(len(token))
+    }
+    variants.add(token)
+    return variants
+
+
+def edit_distance(first, second):
+    previous = list(range(len(second) + 1))
+    for row, char in enumerate(first, 1):
+        current = [row]
+        for column, other in enumerate(second, 1):
+            current.append(
+                min(
+                    previous[column] + 1,
+                    current[column - 1] + 1,
+                    previous[column - 1] + (char != other),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def similarity(first, second):
+    longest = max(len(first), len(second))
+    return 1 - edit_distance(first, second) / longest if longest else 1.0
+
+
+class ClientIndex:
+    def __init__(self, clients=(), max_candidates=2_000):
+        self.max_candidates = max_candidates
+        self._clients = []
+        self._names = []
+        self._postings = {}
+        self._buckets = {}
+        self._vocabulary = []
+        self._variants = {}
+        self.extend(clients)
+
+    def __len__(self):
+        return len(self._clients)
+
+    def extend(self, clients):
+        for client in clients:
+            self.add(client)
+
+    def add(self, client):
+        serial = len(self._clients)
+        name = normalize(client.name)
+        self._clients.append(client)
+        self._names.append(name)
+
+        for token in set(name.split()):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = array("q")
+                self._add_token(token)
+            postings.append(serial)
+
+    def _add_token(self, token):
+        keys = self._buckets.setdefault(token[:BUCKET_SIZE], [])
+        keys.insert(bisect_left(keys, token), token)
+
+        identifier = len(self._vocabulary)
+        self._vocabulary.append(token)
+        for variant in deletions(token):
+            tokens = self._variants.get(variant)
+            if tokens is None:
+                tokens = self._variants[variant] = array("q")
+            tokens.append(identifier)
+
+    def _tokens_with_prefix(self, prefix):
+        if len(prefix) >= BUCKET_SIZE:
+            buckets = (self._buckets.get(prefix[:BUCKET_SIZE], ()),)
+        else:
+            buckets = (
+                self._buckets[key]
+                for key in sorted(self._buckets)
+                if key.startswith(prefix)
+            )
+
+        for keys in buckets:
+            position = bisect_left(keys, prefix)
+            while position < len(keys) and keys[position].startswith(prefix):
+                yield keys[position]
+                position += 1
+
+    def prefix(self, query, limit=10):
+        words = normalize(query).split()
+        if not words:
+            return []
+
+        results = []
+        seen = set()
+        for token in self._tokens_with_prefix(words[0]):
+            for serial in self._postings[token]:
+                if serial in seen:
+                    continue
+                seen.add(serial)
+                tokens = self._names[serial].split()
+                if all(
+                    any(token.startswith(word) for token in tokens)
+                    for word in words[1:]
+                ):
+                    results.append(self._clients[serial])
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    def similar_tokens(self, word, threshold=0.5):
+        candidates = set()
+        for variant in deletions(word):
+            candidates.update(self._variants.get(variant, ()))
+
+        similar = {}
+        for identifier in candidates:
+            token = self._vocabulary[identifier]
+            if (score := similarity(word, token)) >= threshold:
+                similar[token] = score
+        return similar
+
+    def fuzzy(self, query, limit=10, threshold=0.5):
+        words = normalize(query).split()
+        similar = [self.similar_tokens(word, threshold) for word in words]
+        if not any(similar):
+            return []
+
+        driver = min(
+            (tokens for tokens in similar if tokens),
+            key=lambda tokens: sum(map(len, map(self._postings.get, tokens))),
+        )
+        candidates = set()
+        for token in sorted(driver, key=driver.get, reverse=True):
+            postings = self._postings[token]
+            candidates.update(
+                postings[: self.max_candidates - len(candidates)]
+            )
+            if len(candidates) >= self.max_candidates:
+                break
+
+        scored = []
+        for serial in candidates:
+            tokens = self._names[serial].split()
+            score = sum(
+                max(map(scores.get, tokens, (0,) * len(tokens)))
+                for scores in similar
+            ) / len(similar)
+            if score >= threshold:
+                scored.append((score, serial))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [self._clients[serial] for _, serial in scored[:limit]]
+
+    def search(self, query, limit=10):
+        results = self.prefix(query, limit)
+        if len(results) < limit:
+            found = {id(client) for client in results}
+            results += [
+                client
+                for client in self.fuzzy(query, limit)
+                if id(client) not in found
+            ][: limit - len(results)]
+        return results
+
+
+SYLLABLES = (
+    "ba", "be", "ca", "da", "de", "fe", "ga", "go", "jo", "la", "li", "lu",
+    "ma", "mi", "na", "no", "pa", "ra", "ri", "ro", "sa", "se", "ta", "te",
+    "va", "vi", "ze", "ção", "nho", "lha",
+)
+
+
+def random_word(rng):
+    return "".join(
+        rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))
+    ).title()
+
+
+def random_names(rng, count, first_names=5_000, surnames=20_000):
+    first = [random_word(rng) for _ in range(first_names)]
+    last = [random_word(rng) for _ in range(surnames)]
+    for _ in range(count):
+        words = [first[min(int(rng.paretovariate(1.0)), first_names) - 1]]
+        words += [
+            last[min(int(rng.paretovariate(1.0)), surnames) - 1]
+            for _ in range(rng.randint(1, 2))
+        ]
+        yield " ".join(words)
+
+
+def benchmark(clients=1_000_000, queries=1_000):
+    from random import Random
+
+    rng = Random(1)
+    population = [
+        Individual(name, "01-01-1990", "52998224725", "Street")
+        for name in random_names(rng, clients)
+    ]
+
+    index = ClientIndex()
+    start = time.perf_counter()
+    index.extend(population)
+    elapsed = time.perf_counter() - start
+    print(f"Indexed {clients:,} clients: {clients / elapsed:,.0f} clients/s")
+
+    samples = [rng.choice(population).name for _ in range(queries)]
+    prefixes = [name.split()[0][:4] for name in samples]
+    typos = [name[:2] + name[3:] for name in samples]
+    for label, search, terms in (
+        ("Prefix", index.prefix, prefixes),
+        ("Fuzzy", index.fuzzy, typos),
+    ):
+        start = time.perf_counter()
+        found = sum(bool(search(term)) for term in terms)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label} queries: {elapsed / queries * 1000:.2f} ms per query, "
+            f"{found / queries:.0%} with results"
+        )
+
+
+if __name__ == "__main__":
+    benchmark()
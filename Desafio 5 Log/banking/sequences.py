@@ -0,0 +1,159 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .core import DEFAULT_BRANCH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sequences (
+    branch TEXT PRIMARY KEY,
+    high_water INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+SELECT_HIGH_WATER = "SELECT high_water FROM sequences WHERE branch = ?"
+UPSERT_HIGH_WATER = (
+    "INSERT INTO sequences (branch, high_water) VALUES (?, ?) "
+    "ON CONFLICT (branch) DO UPDATE SET high_water = excluded.high_water"
+)
+
+
+class SequenceStore:
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute(SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def high_water(self, branch):
+        with self._lock:
+            row = self._connection.execute(
+                SELECT_HIGH_WATER, (branch,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def reserve(self, branch, size, floor=0):
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    SELECT_HIGH_WATER, (branch,)
+                ).fetchone()
+                start = max(row[0] if row else 0, floor) + 1
+                end = start + size
+                connection.execute(UPSERT_HIGH_WATER, (branch, end - 1))
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+        return start, end
+
+
+class BranchSequence:
+    def __init__(self, store, branch=DEFAULT_BRANCH, block_size=1_000):
+        self.store = store
+        self.branch = branch
+        self.block_size = block_size
+        self._local = threading.local()
+
+    def next(self):
+        block = getattr(self._local, "block", None)
+        if block is None or block[0] >= block[1]:
+            block = self._local.block = list(
+                self.store.reserve(self.branch, self.block_size)
+            )
+        number = block[0]
+        block[0] += 1
+        return number
+
+    __call__ = next
+
+    def advance_past(self, number):
+        self.store.reserve(self.branch, 0, floor=number)
+        block = getattr(self._local, "block", None)
+        if block is not None and block[0] <= number:
+            self._local.block = None
+
+
+class SequenceAllocator:
+    def __init__(self, path, block_size=1_000):
+        self.store = SequenceStore(path)
+        self.block_size = block_size
+        self._sequences = {}
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.store.close()
+
+    def sequence(self, branch=DEFAULT_BRANCH):
+        sequence = self._sequences.get(branch)
+        if sequence is None:
+            with self._lock:
+                sequence = self._sequences.setdefault(
+                    branch, BranchSequence(self.store, branch, self.block_size)
+                )
+        return sequence
+
+    def next(self, branch=DEFAULT_BRANCH):
+        return self.sequence(branch).next()
+
+
+def _allocate(path, count, block_size):
+    allocator = SequenceAllocator(path, block_size)
+    sequence = allocator.sequence()
+    numbers = [sequence.next() for _ in range(count)]
+    allocator.close()
+    return numbers
+
+
+def _report(name, numbers, elapsed, store):
+    assert len(numbers) == len(set(numbers)), "duplicate account numbers"
+    print(
+        f"{name}: {len(numbers) / elapsed:,.0f} numbers/s, "
+        f"high-water mark {store.high_water(DEFAULT_BRANCH):,}"
+    )
+
+
+def benchmark(workers=8, count=200_000, block_size=1_000):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sequences.db")
+        allocator = SequenceAllocator(path, block_size)
+        sequence = allocator.sequence()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(lambda: [sequence() for _ in range(count)])
+                for _ in range(workers)
+            ]
+            numbers = [n for future in futures for n in future.result()]
+        elapsed = time.perf_counter() - start
+        _report(f"{workers} threads", numbers, elapsed, allocator.store)
+
+        start = time.perf_counter()
+        with ProcessPoolExecutor(workers) as executor:
+            futures = [
+                executor.submit(_allocate, path, count, block_size)
+                for _ in range(workers)
+            ]
+            numbers += [n for future in futures for n in future.result()]
+        elapsed = time.perf_counter() - start
+        _report(f"{workers} processes", numbers, elapsed, allocator.store)
+
+        allocator.close()
+
+
+if __name__ == "__main__":
+    benchmark()
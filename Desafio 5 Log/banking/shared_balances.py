@@ -0,0 +1,244 @@
+import sys
+import time
+from datetime import date
+from multiprocessing import Pipe, Process, resource_tracker, shared_memory
+
+from . import core
+
+FIELDS = 5
+SLOT_SIZE = FIELDS * 8
+SEQUENCE, NUMBER, BALANCE, DAY, COUNT = range(FIELDS)
+
+
+def _attach(name):
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+
+    # Before 3.13 attaching registers the segment with the resource
+    # tracker, which unlinks it when a non-owner exits. There is no public
+    # opt-out, so unregister unless the tracker was inherited from the
+    # creating process.
+    inherited = resource_tracker._resource_tracker._fd is not None
+    memory = shared_memory.SharedMemory(name)
+    if not inherited:
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return memory
+
+
+class BalanceTable:
+    def __init__(self, name=None, slots=None):
+        if slots is None:
+            self._memory = _attach(name)
+            self.owner = False
+        else:
+            self._memory = shared_memory.SharedMemory(
+                name, create=True, size=max(slots, 1) * SLOT_SIZE
+            )
+            self.owner = True
+
+        self.name = self._memory.name
+        self.slots = self._memory.size // SLOT_SIZE
+        self._buffer = self._memory.buf[: self.slots * SLOT_SIZE]
+        self._words = self._buffer.cast("Q")
+        self._integers = self._buffer.cast("q")
+        self._floats = self._buffer.cast("d")
+        self._index = {}
+        self._scanned = 0
+
+    @classmethod
+    def attach(cls, name):
+        return cls(name)
+
+    def __len__(self):
+        return self.slots
+
+    def publish(self, slot, balance, day=0, count=0):
+        base = self._base(slot)
+        words = self._words
+        sequence = words[base + SEQUENCE]
+        words[base + SEQUENCE] = sequence + 1
+        self._floats[base + BALANCE] = balance
+        self._integers[base + DAY] = day
+        self._integers[base + COUNT] = count
+        words[base + SEQUENCE] = sequence + 2
+
+    def read(self, slot):
+        base = self._base(slot)
+        words = self._words
+        while True:
+            sequence = words[base + SEQUENCE]
+            if sequence & 1:
+                continue
+            balance = self._floats[base + BALANCE]
+            day = self._integers[base + DAY]
+            count = self._integers[base + COUNT]
+            if words[base + SEQUENCE] == sequence:
+                return balance, day, count
+
+    def balance(self, slot):
+        return self.read(slot)[0]
+
+    def number(self, slot):
+        return self._integers[self._base(slot) + NUMBER]
+
+    def find(self, number):
+        slot = self._index.get(number)
+        if slot is not None:
+            return slot
+
+        integers = self._integers
+        while self._scanned < self.slots:
+            found = integers[self._scanned * FIELDS + NUMBER]
+            if not found:
+                break
+            self._index[found] = self._scanned
+            self._scanned += 1
+        return self._index.get(number)
+
+    def assign(self, number):
+        slot = self.find(number)
+        if slot is None:
+            slot = self._scanned
+            if slot >= self.slots:
+                raise ValueError(f"The balance table {self.name} is full.")
+            self._integers[slot * FIELDS + NUMBER] = number
+            self._index[number] = slot
+            self._scanned += 1
+        return slot
+
+    def balance_of(self, number):
+        slot = self.find(number)
+        if slot is None:
+            raise KeyError(f"Account {number} is not in the balance table.")
+        return self.balance(slot)
+
+    def _base(self, slot):
+        if not 0 <= slot < self.slots:
+            raise IndexError(f"Slot {slot} is outside the balance table.")
+        return slot * FIELDS
+
+    def close(self):
+        for view in (self._words, self._integers, self._floats, self._buffer):
+            view.release()
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
+
+
+class SharedBalances:
+    def __init__(self, prefix, slots=1_000_000):
+        self.prefix = prefix
+        self.slots = slots
+        self.tables = {}
+        self.unpublished = 0
+
+    def table_name(self, branch):
+        return f"{self.prefix}-{branch}"
+
+    def table(self, branch):
+        table = self.tables.get(branch)
+        if table is None:
+            table = self.tables[branch] = BalanceTable(
+                self.table_name(branch), self.slots
+            )
+        return table
+
+    def slot_of(self, branch, number):
+        return self.table(branch).find(number)
+
+    def slot(self, account):
+        return self.table(account.branch).assign(account.number)
+
+    def register(self, account):
+        slot = self.slot(account)
+        self.table(account.branch).publish(slot, account.balance)
+        return slot
+
+    def publish(self, account, balance=None):
+        slot = self.slot(account)
+        table = self.table(account.branch)
+        today = date.today().toordinal()
+        _, day, count = table.read(slot)
+        table.publish(
+            slot,
+            account.balance if balance is None else balance,
+            today,
+            count + 1 if day == today else 1,
+        )
+
+    def __call__(self, account, entry):
+        try:
+            self.publish(account, entry.get("balance"))
+        except ValueError:
+            self.unpublished += 1
+
+    def attach(self):
+        core.transaction_listeners.append(self)
+        return self
+
+    def detach(self):
+        core.transaction_listeners.remove(self)
+
+    def close(self):
+        for table in self.tables.values():
+            table.close()
+        self.tables.clear()
+
+
+def _read_shared(name, slots, reads, connection):
+    table = BalanceTable.attach(name)
+    torn = 0
+    start = time.perf_counter()
+    for index in range(reads):
+        balance, _, count = table.read(table.find(index % slots + 1))
+        torn += balance != count
+    elapsed = time.perf_counter() - start
+    table.close()
+    connection.send((reads / elapsed, torn))
+
+
+def _read_through_writer(slots, reads, connection):
+    start = time.perf_counter()
+    for index in range(reads):
+        connection.send(index % slots + 1)
+        connection.recv()
+    connection.send((reads / (time.perf_counter() - start), 0))
+
+
+def benchmark(slots=100_000, reads=1_000_000, writes=1_000_000):
+    table = BalanceTable(slots=slots)
+    try:
+        for number in range(1, slots + 1):
+            table.assign(number)
+        receiver, sender = Pipe(duplex=False)
+        reader = Process(
+            target=_read_shared, args=(table.name, slots, reads, sender)
+        )
+        reader.start()
+        start = time.perf_counter()
+        for index in range(writes):
+            count = index // slots + 1
+            table.publish(index % slots, float(count), 0, count)
+        elapsed = time.perf_counter() - start
+        rate, torn = receiver.recv()
+        reader.join()
+        print(f"Writer: {writes / elapsed:,.0f} balance updates/s")
+        print(f"Shared-memory reader: {rate:,.0f} reads/s, {torn} torn reads")
+
+        requests = min(reads, 50_000)
+        parent, child = Pipe()
+        reader = Process(
+            target=_read_through_writer, args=(slots, requests, child)
+        )
+        reader.start()
+        for _ in range(requests):
+            parent.send(table.read(table.find(parent.recv())))
+        rate, _ = parent.recv()
+        reader.join()
+        print(f"Reader asking the writer over a pipe: {rate:,.0f} reads/s")
+    finally:
+        table.close()
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,248 @@
+import os
+import time
+import tracemalloc
+from array import array
+from bisect import bisect
+from collections import Counter
+from contextlib import redirect_stdout
+from itertools import accumulate
+from random import Random
+
+from .branches import Bank
+from .core import Deposit, Individual, Withdrawal
+from .limits import TRANSACTION
+from .validation import generate_cpf
+
+DEPOSIT = "deposit"
+WITHDRAWAL = "withdrawal"
+STATEMENT = "statement"
+DEFAULT_MIX = {DEPOSIT: 0.45, WITHDRAWAL: 0.35, STATEMENT: 0.2}
+PERCENTILES = (50, 90, 99, 99.9)
+
+FIRST_NAMES = ("Ana", "Bruno", "Carla", "Diego", "Elisa", "Felipe", "Gabriela")
+LAST_NAMES = ("Almeida", "Barbosa", "Costa", "Dias", "Ferreira", "Souza")
+
+
+def build_bank(clients, accounts, branches=1, seed=None):
+    rng = Random(seed)
+    bank = Bank()
+    population = []
+    while len(population) < clients:
+        cpf = generate_cpf(rng)
+        if bank.find_client(cpf):
+            continue
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        birth_date = (
+            f"{rng.randint(1, 28):02d}-{rng.randint(1, 12):02d}-"
+            f"{rng.randint(1940, 2005)}"
+        )
+        client = Individual(name, birth_date, cpf, f"Street {len(population)}")
+        population.append(bank.add_client(client))
+
+    for index in range(accounts):
+        client = (
+            population[index] if index < clients else rng.choice(population)
+        )
+        bank.open_account(client, branch=f"{index % branches + 1:04d}")
+    return bank
+
+
+class ZipfSampler:
+    def __init__(self, items, exponent=1.1, rng=None):
+        self.rng = rng or Random()
+        self.items = list(items)
+        self.rng.shuffle(self.items)
+        self._weights = list(
+            accumulate(
+                1 / rank**exponent for rank in range(1, len(self.items) + 1)
+            )
+        )
+        self._total = self._weights[-1]
+
+    def __call__(self):
+        index = bisect(self._weights, self.rng.random() * self._total)
+        return self.items[min(index, len(self.items) - 1)]
+
+
+class SimulationReport:
+    def __init__(self, rate, duration):
+        self.rate = rate
+        self.duration = duration
+        self.elapsed = 0.0
+        self.lag = 0.0
+        self.latencies = array("d")
+        self.operations = {kind: [0, 0] for kind in DEFAULT_MIX}
+        self.downgraded = Counter()
+        self.memory = []
+
+    def record(self, kind, accepted, latency, drawn=None):
+        self.latencies.append(latency)
+        self.operations[kind][accepted is False] += 1
+        if drawn is not None and drawn != kind:
+            self.downgraded[drawn, kind] += 1
+
+    @property
+    def throughput(self):
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, percent, ordered=None):
+        ordered = ordered or sorted(self.latencies)
+        if not ordered:
+            return 0.0
+        index = round(percent / 100 * (len(ordered) - 1))
+        return ordered[index]
+
+    def __str__(self):
+        ordered = sorted(self.latencies)
+        lines = [
+            f"Offered {self.rate:,.0f} ops/s for {self.duration:.1f}s: "
+            f"{len(ordered):,} operations, "
+            f"{self.throughput:,.0f} ops/s achieved, "
+            f"{self.lag:.2f}s behind schedule at the end"
+        ]
+        lines += [
+            f"  {kind}: {accepted:,} served"
+            if kind == STATEMENT
+            else f"  {kind}: {accepted:,} accepted, {rejected:,} rejected"
+            for kind, (accepted, rejected) in self.operations.items()
+        ]
+        lines += [
+            f"  {drawn} drawn but run as {kind}: {count:,}"
+            for (drawn, kind), count in sorted(self.downgraded.items())
+        ]
+        lines.append(
+            "  latency "
+            + ", ".join(
+                f"p{percent:g} "
+                f"{self.percentile(percent, ordered) * 1e6:,.0f} us"
+                for percent in PERCENTILES
+            )
+            + f", max {(ordered[-1] if ordered else 0) * 1e6:,.0f} us"
+        )
+        lines += [
+            f"  memory at {moment:.1f}s: {size / 1024 / 1024:,.1f} MiB"
+            for moment, size in self.memory
+        ]
+        return "\n".join(lines)
+
+
+class Simulation:
+    def __init__(
+        self,
+        bank,
+        mix=None,
+        exponent=1.1,
+        day_seconds=None,
+        seed=None,
+    ):
+        self.bank = bank
+        self.rng = Random(seed)
+        self.accounts = list(bank.accounts())
+        self.sampler = ZipfSampler(self.accounts, exponent, self.rng)
+        mix = mix or DEFAULT_MIX
+        self._kinds = list(mix)
+        self._weights = list(accumulate(mix.values()))
+        self.day_seconds = day_seconds
+        self._touched = set()
+
+    def choose(self, account):
+        drawn = self.rng.choices(self._kinds, cum_weights=self._weights)[0]
+        if drawn == STATEMENT:
+            return drawn, drawn, 0
+
+        if account.limits.check(TRANSACTION, 0):
+            return drawn, STATEMENT, 0
+
+        if drawn == WITHDRAWAL:
+            amount = int(min(self.rng.expovariate(1 / 80), account.balance))
+            if amount > 0 and not account.limits.check(
+                Withdrawal.__name__, amount
+            ):
+                return drawn, drawn, amount
+
+        amount = round(max(self.rng.lognormvariate(4, 1), 1), 2)
+        return drawn, DEPOSIT, amount
+
+    def execute(self, account):
+        drawn, kind, amount = self.choose(account)
+        if kind == STATEMENT:
+            "".join(
+                f"\n{transaction['type']}:\t$ {transaction['amount']:.2f}\t"
+                + f"Date:\t{transaction['date']}"
+                for transaction in account.history.iter_transactions()
+            )
+            return drawn, kind, None
+
+        self._touched.add(account)
+        transaction = (Withdrawal if kind == WITHDRAWAL else Deposit)(amount)
+        return (
+            drawn,
+            kind,
+            account.client.perform_transaction(account, transaction),
+        )
+
+    def run(self, rate, duration, sample_interval=1.0, trace_memory=False):
+        report = SimulationReport(rate, duration)
+        arrivals = self.rng.expovariate
+        if trace_memory:
+            tracemalloc.start()
+
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            start = time.perf_counter()
+            scheduled = start
+            next_sample = start
+            next_day = start + (self.day_seconds or duration + 1)
+            deadline = start + duration
+
+            while True:
+                scheduled += arrivals(rate)
+                if scheduled > deadline:
+                    break
+
+                now = time.perf_counter()
+                if now > deadline:
+                    report.lag = now - scheduled
+                    break
+                if scheduled > now:
+                    time.sleep(scheduled - now)
+
+                drawn, kind, accepted = self.execute(self.sampler())
+                finished = time.perf_counter()
+                report.record(kind, accepted, finished - scheduled, drawn)
+
+                if finished >= next_day:
+                    for account in self._touched:
+                        account.limits.reset()
+                    self._touched.clear()
+                    next_day += self.day_seconds
+                if trace_memory and finished >= next_sample:
+                    report.memory.append(
+                        (finished - start, tracemalloc.get_traced_memory()[0])
+                    )
+                    next_sample += sample_interval
+
+            report.elapsed = time.perf_counter() - start
+
+        if trace_memory:
+            tracemalloc.stop()
+        return report
+
+
+def benchmark(
+    clients=10_000, accounts=20_000, rates=(5_000, 20_000, 80_000)
+):
+    start = time.perf_counter()
+    bank = build_bank(clients, accounts, branches=4, seed=1)
+    print(
+        f"Built {clients:,} clients and {accounts:,} accounts "
+        f"in {time.perf_counter() - start:.2f}s"
+    )
+
+    simulation = Simulation(bank, day_seconds=1.0, seed=1)
+    for rate in rates:
+        print(simulation.run(rate, duration=3.0))
+    print(simulation.run(rates[0], duration=5.0, trace_memory=True))
+
+
+if __name__ == "__main__":
+    benchmark()
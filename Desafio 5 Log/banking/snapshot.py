@@ -0,0 +1,290 @@
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+import time
+from array import array
+from datetime import datetime
+from itertools import accumulate
+
+from .core import Account, CheckingAccount, Deposit, Individual, Withdrawal
+from .export import TYPE_CODES, TYPE_NAMES, parse_date
+
+MAGIC = b"BKSNAP02"
+HEADER = struct.Struct("<QQ")
+BUFFER_HEADER = struct.Struct("<Q")
+NO_LIMIT = float("inf")
+NO_WITHDRAWAL_LIMIT = 2**63 - 1
+LIMIT_WINDOW = 24 * 60 * 60
+ACCOUNT_CLASSES = (Account, CheckingAccount)
+ACCOUNT_CODES = {
+    account_class.__name__: code
+    for code, account_class in enumerate(ACCOUNT_CLASSES)
+}
+TEXT_FIELDS = ("name", "birth_date", "cpf", "address")
+COLUMNS = (
+    ("text_offsets", "q"),
+    ("text", "B"),
+    ("branch", "H"),
+    ("number", "q"),
+    ("client", "q"),
+    ("kind", "B"),
+    ("balance", "d"),
+    ("limit", "d"),
+    ("withdrawal_limit", "q"),
+    ("history_end", "q"),
+    ("timestamp", "q"),
+    ("amount", "d"),
+    ("type", "B"),
+)
+
+
+def _column(buffer, code):
+    view = memoryview(buffer)
+    if view.format != code:
+        view = view.cast("B").cast(code)
+    return view
+
+
+def _from_buffers(*buffers):
+    return Snapshot(
+        {
+            name: _column(buffer, code)
+            for (name, code), buffer in zip(COLUMNS, buffers)
+        }
+    )
+
+
+class Snapshot:
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["number"])
+
+    def __reduce_ex__(self, protocol):
+        columns = [self.columns[name] for name, _ in COLUMNS]
+        if protocol >= 5:
+            columns = [pickle.PickleBuffer(column) for column in columns]
+        else:
+            columns = [memoryview(column).tobytes() for column in columns]
+        return _from_buffers, tuple(columns)
+
+    @property
+    def nbytes(self):
+        return sum(
+            memoryview(column).nbytes for column in self.columns.values()
+        )
+
+    @classmethod
+    def from_accounts(cls, accounts):
+        columns = {name: array(code) for name, code in COLUMNS}
+        clients = {}
+        texts = []
+        history_end = 0
+        last_date = None
+        last_timestamp = 0
+
+        for account in accounts:
+            client = account.client
+            index = clients.get(id(client))
+            if index is None:
+                index = clients[id(client)] = len(clients)
+                texts.extend(
+                    getattr(client, field).encode("UTF-8")
+                    for field in TEXT_FIELDS
+                )
+
+            columns["branch"].append(int(account.branch))
+            columns["number"].append(account.number)
+            columns["client"].append(index)
+            columns["kind"].append(ACCOUNT_CODES[account.__class__.__name__])
+            columns["balance"].append(account.balance)
+            columns["limit"].append(getattr(account, "_limit", NO_LIMIT))
+            columns["withdrawal_limit"].append(
+                getattr(account, "_withdrawal_limit", NO_WITHDRAWAL_LIMIT)
+            )
+
+            for transaction in account.history.iter_transactions():
+                date = transaction["date"]
+                if date != last_date:
+                    last_date = date
+                    last_timestamp = int(parse_date(date))
+                columns["timestamp"].append(last_timestamp)
+                columns["amount"].append(transaction["amount"])
+                columns["type"].append(TYPE_CODES[transaction["type"]])
+                history_end += 1
+            columns["history_end"].append(history_end)
+
+        columns["text_offsets"] = array(
+            "q", accumulate(map(len, texts), initial=0)
+        )
+        columns["text"] = array("B", b"".join(texts))
+        return cls(columns)
+
+    def clients(self):
+        offsets = self.columns["text_offsets"]
+        text = memoryview(self.columns["text"]).cast("B")
+        fields = len(TEXT_FIELDS)
+        for start in range(0, len(offsets) - 1, fields):
+            values = [
+                str(text[offsets[index] : offsets[index + 1]], "UTF-8")
+                for index in range(start, start + fields)
+            ]
+            yield Individual(*values)
+
+    def restore(self):
+        columns = self.columns
+        clients = list(self.clients())
+        accounts = []
+        start = 0
+        last_timestamp = None
+        date = moment = None
+        cutoff = time.time() - LIMIT_WINDOW
+
+        for index, end in enumerate(columns["history_end"]):
+            client = clients[columns["client"][index]]
+            account_class = ACCOUNT_CLASSES[columns["kind"][index]]
+            branch = f"{columns['branch'][index]:04d}"
+            if account_class is CheckingAccount:
+                account = account_class(
+                    columns["number"][index],
+                    client,
+                    limit=columns["limit"][index],
+                    withdrawal_limit=columns["withdrawal_limit"][index],
+                    branch=branch,
+                )
+            else:
+                account = account_class(
+                    columns["number"][index], client, branch=branch
+                )
+            account._balance = columns["balance"][index]
+
+            transactions = account.history.transactions
+            for timestamp, amount, kind in zip(
+                columns["timestamp"][start:end],
+                columns["amount"][start:end],
+                columns["type"][start:end],
+            ):
+                if timestamp != last_timestamp:
+                    last_timestamp = timestamp
+                    moment = datetime.fromtimestamp(timestamp)
+                    date = moment.strftime("%d-%m-%Y %H:%M:%S")
+                transactions.append(
+                    {"type": TYPE_NAMES[kind], "amount": amount, "date": date}
+                )
+                if timestamp >= cutoff:
+                    account.limits.record(TYPE_NAMES[kind], amount, moment)
+            start = end
+
+            client.add_account(account)
+            accounts.append(account)
+        return accounts
+
+
+def dumps(snapshot):
+    buffers = []
+    header = pickle.dumps(snapshot, protocol=5, buffer_callback=buffers.append)
+    return header, buffers
+
+
+def loads(header, buffers):
+    return pickle.loads(header, buffers=buffers)
+
+
+def write_snapshot(snapshot, path):
+    header, buffers = dumps(snapshot)
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(HEADER.pack(len(header), len(buffers)))
+        file.write(header)
+        file.write(bytes(-len(header) % 8))
+        for buffer in buffers:
+            data = buffer.raw()
+            file.write(BUFFER_HEADER.pack(data.nbytes))
+            file.write(data)
+            file.write(bytes(-data.nbytes % 8))
+    return os.path.getsize(path)
+
+
+def read_snapshot(path):
+    with open(path, "rb") as file:
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if data[: len(MAGIC)] != MAGIC:
+        data.close()
+        raise ValueError(f"{path} is not a bank snapshot file.")
+
+    view = memoryview(data)
+    offset = len(MAGIC)
+    size, count = HEADER.unpack_from(data, offset)
+    offset += HEADER.size
+    header = view[offset : offset + size]
+    offset += size + (-size % 8)
+
+    buffers = []
+    for _ in range(count):
+        (size,) = BUFFER_HEADER.unpack_from(data, offset)
+        offset += BUFFER_HEADER.size
+        buffers.append(view[offset : offset + size])
+        offset += size + (-size % 8)
+    return loads(header, buffers)
+
+
+def benchmark(accounts=100_000, transactions=20):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    operations = (Deposit(100), Withdrawal(40))
+    bank = []
+    for number in range(1, accounts + 1):
+        account = CheckingAccount.new_account(client, number)
+        for index in range(transactions):
+            account.history.add_transaction(operations[index % 2])
+        bank.append(account)
+
+    start = time.perf_counter()
+    snapshot = Snapshot.from_accounts(bank)
+    elapsed = time.perf_counter() - start
+    gigabytes = snapshot.nbytes / 1e9
+    print(
+        f"Columnar build: {accounts / elapsed:,.0f} accounts/s, "
+        f"{snapshot.nbytes / 1024 / 1024:,.1f} MiB of columns"
+    )
+
+    start = time.perf_counter()
+    header, buffers = dumps(snapshot)
+    restored = loads(header, buffers)
+    elapsed = time.perf_counter() - start
+    print(f"Out-of-band pickle round trip: {gigabytes / elapsed:,.1f} GB/s")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bank.snapshot")
+        start = time.perf_counter()
+        write_snapshot(snapshot, path)
+        written = time.perf_counter() - start
+        start = time.perf_counter()
+        restored = read_snapshot(path)
+        read = time.perf_counter() - start
+        print(
+            f"Snapshot file: write {gigabytes / written:,.2f} GB/s, "
+            f"mmap read {gigabytes / read:,.1f} GB/s"
+        )
+
+        start = time.perf_counter()
+        restored.restore()
+        elapsed = time.perf_counter() - start
+        print(f"Restore to objects: {accounts / elapsed:,.0f} accounts/s")
+        del restored
+
+    start = time.perf_counter()
+    payload = pickle.dumps(bank, protocol=5)
+    pickle.loads(payload)
+    elapsed = time.perf_counter() - start
+    print(
+        f"Object graph pickle round trip: {len(payload) / 1e9 / elapsed:,.2f} "
+        f"GB/s over {len(payload) / 1024 / 1024:,.1f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,65 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+OPTIONAL_MODULES = (
+    "banking.storage",
+    "banking.end_of_day",
+    "banking.events",
+    "concurrent.futures",
+    "csv",
+    "multiprocessing",
+    "sqlite3",
+)
+COMMANDS = {
+    "python": "pass",
+    "import banking": "import banking",
+    "import desafio_5": "import desafio_5",
+}
+
+
+def _root():
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=_root())
+    return time.perf_counter() - start
+
+
+def loaded_optional_modules():
+    code = (
+        "import sys, banking, desafio_5; "
+        f"print(','.join(m for m in {OPTIONAL_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        cwd=_root(),
+    ).stdout.strip()
+    return output.split(",") if output else []
+
+
+def benchmark(runs=20):
+    timings = {
+        name: statistics.median(_run(code) for _ in range(runs)) * 1000
+        for name, code in COMMANDS.items()
+    }
+    baseline = timings["python"]
+    for name, milliseconds in timings.items():
+        print(
+            f"{name}: {milliseconds:.1f} ms "
+            f"(+{milliseconds - baseline:.1f} ms over bare interpreter)"
+        )
+
+    loaded = loaded_optional_modules()
+    print(f"Optional modules loaded at import: {', '.join(loaded) or 'none'}")
+
+
+if __name__ == "__main__":
+    benchmark()
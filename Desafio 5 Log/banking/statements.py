@@ -0,0 +1,191 @@
+import os
+import tempfile
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from itertools import islice
+
+from .aggregates import DEBITS
+from .core import CheckingAccount, Deposit, Individual, Withdrawal
+
+HEADER = "Statement {}\nAgency: {}\nAccount: {}\nOwner: {}\n".format
+ENTRY = "\n{}:\t$ {:.2f}\tDate:\t{}".format
+FOOTER = "\n\nBalance:\t$ {:.2f}\n".format
+EMPTY = "\nNo transactions have been made."
+
+
+def month_key(month):
+    if isinstance(month, (date, datetime)):
+        return month.strftime("%m-%Y")
+    return month
+
+
+def statement_name(branch, number, month):
+    return f"{branch}-{number}-{month}.txt"
+
+
+def extract_month(accounts, month):
+    chunk = {
+        "branches": [],
+        "numbers": [],
+        "names": [],
+        "balances": [],
+        "entries": [],
+    }
+    target = month[3:], month[:2]
+    for account in accounts:
+        history, balance = account.snapshot()
+        entries = []
+        closing = None
+        later = 0.0
+        for entry in history:
+            key = entry["date"][6:10], entry["date"][3:5]
+            if key > target:
+                amount = entry["amount"]
+                later += -amount if entry["type"] in DEBITS else amount
+                continue
+            if key == target:
+                entries.append((entry["type"], entry["amount"], entry["date"]))
+            closing = entry.get("balance")
+
+        chunk["branches"].append(account.branch)
+        chunk["numbers"].append(account.number)
+        chunk["names"].append(account.client.name)
+        chunk["balances"].append(
+            balance - later if closing is None else closing
+        )
+        chunk["entries"].append(entries)
+    return chunk
+
+
+def render_statement(branch, number, name, entries, balance, month):
+    lines = [ENTRY(*entry) for entry in entries] or [EMPTY]
+    return "".join(
+        (HEADER(month, branch, number, name), *lines, FOOTER(balance))
+    )
+
+
+def render_chunk(chunk, month, directory=None):
+    rendered = []
+    written = 0
+    for branch, number, name, balance, entries in zip(
+        chunk["branches"],
+        chunk["numbers"],
+        chunk["names"],
+        chunk["balances"],
+        chunk["entries"],
+    ):
+        data = render_statement(
+            branch, number, name, entries, balance, month
+        ).encode("UTF-8")
+        filename = statement_name(branch, number, month)
+        if directory is None:
+            rendered.append((filename, data))
+        else:
+            with open(os.path.join(directory, filename), "wb") as file:
+                file.write(data)
+        written += len(data)
+    return rendered, written
+
+
+class StatementReport:
+    def __init__(self, month, destination):
+        self.month = month
+        self.destination = destination
+        self.accounts = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    @property
+    def accounts_per_second(self):
+        return self.accounts / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self):
+        return (
+            f"Statements for {self.month}: {self.accounts:,} accounts, "
+            f"{self.bytes / 1024 / 1024:,.1f} MiB to {self.destination} "
+            f"in {self.elapsed:.2f}s ({self.accounts_per_second:,.0f} "
+            "accounts/s)"
+        )
+
+
+class StatementJob:
+    def __init__(self, chunk_size=5_000, max_workers=None):
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def to_directory(self, accounts, directory, month=None, executor=None):
+        os.makedirs(directory, exist_ok=True)
+        return self._run(accounts, month, directory, None, executor)
+
+    def to_archive(self, accounts, path, month=None, executor=None):
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            return self._run(accounts, month, path, archive, executor)
+
+    def _run(self, accounts, month, destination, archive, executor):
+        month = month_key(month or date.today())
+        report = StatementReport(month, destination)
+        start = time.perf_counter()
+
+        if executor is None:
+            with ProcessPoolExecutor(self.max_workers) as pool:
+                self._render(pool, accounts, month, archive, report)
+        else:
+            self._render(executor, accounts, month, archive, report)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def _render(self, executor, accounts, month, archive, report):
+        directory = None if archive else report.destination
+        pending = deque()
+        accounts = iter(accounts)
+
+        while True:
+            while len(pending) < self.max_workers * 2:
+                batch = list(islice(accounts, self.chunk_size))
+                if not batch:
+                    break
+                chunk = extract_month(batch, month)
+                pending.append(
+                    (
+                        len(batch),
+                        executor.submit(render_chunk, chunk, month, directory),
+                    )
+                )
+
+            if not pending:
+                break
+
+            count, future = pending.popleft()
+            rendered, written = future.result()
+            for filename, data in rendered:
+                archive.writestr(filename, data)
+            report.accounts += count
+            report.bytes += written
+
+
+def benchmark(accounts=100_000, transactions=8):
+    client = Individual("Benchmark", "01-01-1990", "52998224725", "Street")
+    operations = (Deposit(100), Withdrawal(35.5))
+    bank = []
+    for number in range(1, accounts + 1):
+        account = CheckingAccount.new_account(client, number)
+        for index in range(transactions):
+            operations[index % 2].commit(account)
+        bank.append(account)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for workers in sorted({1, os.cpu_count() or 1}):
+            job = StatementJob(max_workers=workers)
+            print(f"{workers} worker(s)")
+            print(job.to_directory(bank, os.path.join(directory, "files")))
+            print(
+                job.to_archive(bank, os.path.join(directory, "statements.zip"))
+            )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,417 @@
+import os
+import queue
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from itertools import islice
+
+from .core import CheckingAccount, Deposit, Individual
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS clients (
+    cpf TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    birth_date TEXT NOT NULL,
+    address TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS accounts (
+    branch TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    cpf TEXT NOT NULL REFERENCES clients (cpf),
+    kind TEXT NOT NULL,
+    balance REAL NOT NULL,
+    credit_limit REAL,
+    withdrawal_limit INTEGER,
+    PRIMARY KEY (branch, number)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS accounts_cpf ON accounts (cpf);
+
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    branch TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    amount REAL NOT NULL,
+    timestamp TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS history_account
+    ON history (branch, number, timestamp);
+
+CREATE INDEX IF NOT EXISTS history_timestamp ON history (timestamp);
+"""
+
+UPSERT_CLIENT = (
+    "INSERT INTO clients (cpf, name, birth_date, address) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (cpf) DO UPDATE SET "
+    "name = excluded.name, birth_date = excluded.birth_date, "
+    "address = excluded.address"
+)
+UPSERT_ACCOUNT = (
+    "INSERT INTO accounts "
+    "(branch, number, cpf, kind, balance, credit_limit, withdrawal_limit) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (branch, number) DO UPDATE SET balance = excluded.balance"
+)
+INSERT_HISTORY = (
+    "INSERT INTO history (branch, number, type, amount, timestamp) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+SELECT_CLIENT = (
+    "SELECT cpf, name, birth_date, address FROM clients WHERE cpf = ?"
+)
+SELECT_CLIENTS = "SELECT cpf, name, birth_date, address FROM clients"
+SELECT_ACCOUNT = (
+    "SELECT branch, number, cpf, kind, balance, credit_limit, "
+    "withdrawal_limit FROM accounts WHERE branch = ? AND number = ?"
+)
+SELECT_CLIENT_ACCOUNTS = (
+    "SELECT branch, number, cpf, kind, balance, credit_limit, "
+    "withdrawal_limit FROM accounts WHERE cpf = ? ORDER BY branch, number"
+)
+SELECT_ACCOUNTS = (
+    "SELECT branch, number, cpf, kind, balance, credit_limit, "
+    "withdrawal_limit FROM accounts ORDER BY branch, number"
+)
+SELECT_HISTORY = (
+    "SELECT type, amount, timestamp FROM history "
+    "WHERE branch = ? AND number = ? ORDER BY timestamp, id"
+)
+SELECT_RECENT_HISTORY = (
+    "SELECT type, amount, timestamp FROM ("
+    "SELECT id, type, amount, timestamp FROM history "
+    "WHERE branch = ? AND number = ? ORDER BY timestamp DESC, id DESC "
+    "LIMIT ?) ORDER BY timestamp, id"
+)
+SELECT_ALL_HISTORY = (
+    "SELECT branch, number, type, amount, timestamp FROM history "
+    "ORDER BY branch, number, timestamp, id"
+)
+SELECT_HISTORY_BETWEEN = (
+    "SELECT branch, number, type, amount, timestamp FROM history "
+    "WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp, id"
+)
+
+ACCOUNT_TYPES = {CheckingAccount.__name__: CheckingAccount}
+
+
+def to_timestamp(date):
+    return f"{date[6:10]}-{date[3:5]}-{date[0:2]}{date[10:]}"
+
+
+def from_timestamp(timestamp):
+    day, month, year = timestamp[8:10], timestamp[5:7], timestamp[0:4]
+    return f"{day}-{month}-{year}{timestamp[10:]}"
+
+
+class ConnectionPool:
+    def __init__(self, path, size=4):
+        self.path = path
+        self.size = size
+        self._created = 0
+        self._lock = threading.Lock()
+        self._idle = queue.LifoQueue()
+
+    def _connect(self):
+        connection = sqlite3.connect(
+            self.path, check_same_thread=False, cached_statements=256
+        )
+        connection.execute("PRAGMA query_only = ON")
+        return connection
+
+    @contextmanager
+    def connection(self):
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            connection = self._connect() if create else self._idle.get()
+
+        try:
+            yield connection
+        finally:
+            self._idle.put(connection)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class SQLiteRepository:
+    def __init__(self, path, readers=4, batch_size=10_000):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._persisted = weakref.WeakKeyDictionary()
+
+        self._writer = sqlite3.connect(
+            path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        self._writer.execute("PRAGMA journal_mode = WAL")
+        self._writer.execute("PRAGMA synchronous = NORMAL")
+        self._writer.execute("PRAGMA foreign_keys = ON")
+        self._writer.executescript(SCHEMA)
+        self._readers = ConnectionPool(path, readers)
+
+    def close(self):
+        self._readers.close()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            self._writer.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._writer
+            except BaseException:
+                self._writer.execute("ROLLBACK")
+                raise
+            self._writer.execute("COMMIT")
+
+    def _executemany(self, statement, rows):
+        rows = iter(rows)
+        while batch := list(islice(rows, self.batch_size)):
+            with self.transaction() as connection:
+                connection.executemany(statement, batch)
+
+    def save_clients(self, clients):
+        self._executemany(
+            UPSERT_CLIENT,
+            (
+                (client.cpf, client.name, client.birth_date, client.address)
+                for client in clients
+            ),
+        )
+
+    def save_accounts(self, accounts):
+        accounts = iter(accounts)
+        while batch := list(islice(accounts, self.batch_size)):
+            counts = [len(account.history.transactions) for account in batch]
+            with self.transaction() as connection:
+                connection.executemany(
+                    UPSERT_ACCOUNT, map(self._account_row, batch)
+                )
+                connection.executemany(
+                    INSERT_HISTORY, self._pending_history(batch, counts)
+                )
+            self._mark_persisted(batch, counts)
+
+    def sync_account(self, account):
+        self.save_accounts((account,))
+
+    def _account_row(self, account):
+        return (
+            account.branch,
+            account.number,
+            account.client.cpf,
+            account.__class__.__name__,
+            account.balance,
+            getattr(account, "_limit", None),
+            getattr(account, "_withdrawal_limit", None),
+        )
+
+    def _pending_history(self, accounts, counts):
+        for account, count in zip(accounts, counts):
+            transactions = account.history.transactions
+            start = self._persisted.get(account.history, 0)
+            for transaction in transactions[start:count]:
+                yield (
+                    account.branch,
+                    account.number,
+                    transaction["type"],
+                    transaction["amount"],
+                    to_timestamp(transaction["date"]),
+                )
+
+    def _mark_persisted(self, accounts, counts=None):
+        if counts is None:
+            counts = [
+                len(account.history.transactions) for account in accounts
+            ]
+        for account, count in zip(accounts, counts):
+            self._persisted[account.history] = count
+
+    def load_client(self, cpf, history_limit=None):
+        with self._readers.connection() as connection:
+            row = connection.execute(SELECT_CLIENT, (cpf,)).fetchone()
+            if not row:
+                return None
+
+            client = self._client(row)
+            for account_row in connection.execute(
+                SELECT_CLIENT_ACCOUNTS, (cpf,)
+            ).fetchall():
+                self._account(
+                    connection, account_row, client, history_limit
+                )
+        return client
+
+    def load_account(self, branch, number, history_limit=None, clients=None):
+        with self._readers.connection() as connection:
+            row = connection.execute(
+                SELECT_ACCOUNT, (branch, number)
+            ).fetchone()
+            if not row:
+                return None
+
+            client = clients.get(row[2]) if clients is not None else None
+            if client is None:
+                client = self._client(
+                    connection.execute(SELECT_CLIENT, (row[2],)).fetchone()
+                )
+            return self._account(connection, row, client, history_limit)
+
+    def load_all(self):
+        with self._readers.connection() as connection:
+            clients = {
+                row[0]: self._client(row)
+                for row in connection.execute(SELECT_CLIENTS)
+            }
+            accounts = {}
+            for row in connection.execute(SELECT_ACCOUNTS):
+                account = self._new_account(row, clients[row[2]])
+                accounts[(account.branch, account.number)] = account
+
+            rows = connection.execute(SELECT_ALL_HISTORY)
+            for branch, number, kind, amount, timestamp in rows:
+                accounts[(branch, number)].history.transactions.append(
+                    self._entry(kind, amount, timestamp)
+                )
+
+        for account in accounts.values():
+            self._restore_limits(account)
+        self._mark_persisted(accounts.values())
+        return list(clients.values()), list(accounts.values())
+
+    def transactions_between(self, start, end):
+        with self._readers.connection() as connection:
+            rows = connection.execute(
+                SELECT_HISTORY_BETWEEN,
+                (
+                    start.strftime("%Y-%m-%d %H:%M:%S"),
+                    end.strftime("%Y-%m-%d %H:%M:%S"),
+                ),
+            )
+            for branch, number, kind, amount, timestamp in rows:
+                yield branch, number, self._entry(kind, amount, timestamp)
+
+    def _client(self, row):
+        cpf, name, birth_date, address = row
+        return Individual(
+            name=name, birth_date=birth_date, cpf=cpf, address=address
+        )
+
+    def _new_account(self, row, client):
+        branch, number, _, kind, balance, limit, withdrawal_limit = row
+        account = ACCOUNT_TYPES[kind](
+            number,
+            client,
+            limit=limit,
+            withdrawal_limit=withdrawal_limit,
+            branch=branch,
+        )
+        account._balance = balance
+        client.add_account(account)
+        return account
+
+    def _account(self, connection, row, client, history_limit):
+        account = self._new_account(row, client)
+        if history_limit is None:
+            rows = connection.execute(SELECT_HISTORY, row[:2])
+        else:
+            rows = connection.execute(
+                SELECT_RECENT_HISTORY, (*row[:2], history_limit)
+            )
+        account.history.transactions.extend(
+            self._entry(kind, amount, timestamp)
+            for kind, amount, timestamp in rows
+        )
+        self._restore_limits(account)
+        self._mark_persisted((account,))
+        return account
+
+    def _entry(self, kind, amount, timestamp):
+        return {
+            "type": kind,
+            "amount": amount,
+            "date": from_timestamp(timestamp),
+        }
+
+    def _restore_limits(self, account):
+        cutoff = datetime.now() - timedelta(days=1)
+        recent = []
+        for transaction in reversed(account.history.transactions):
+            date = datetime.strptime(transaction["date"], "%d-%m-%Y %H:%M:%S")
+            if date < cutoff:
+                break
+            recent.append((transaction, date))
+
+        for transaction, date in reversed(recent):
+            account.limits.record(
+                transaction["type"], transaction["amount"], date
+            )
+
+
+def benchmark(accounts=100_000, transactions=10):
+    clients = [
+        Individual(
+            name=f"Client {number}",
+            birth_date="01-01-1990",
+            cpf=f"{number:011d}",
+            address="Street, 1 - Center - City/ST",
+        )
+        for number in range(1, accounts + 1)
+    ]
+    bank = []
+    deposit = Deposit(100)
+    for client in clients:
+        account = CheckingAccount.new_account(client, len(bank) + 1)
+        for _ in range(transactions):
+            account.history.add_transaction(deposit)
+        client.add_account(account)
+        bank.append(account)
+
+    with tempfile.TemporaryDirectory() as directory:
+        with SQLiteRepository(os.path.join(directory, "bank.db")) as repo:
+            start = time.perf_counter()
+            repo.save_clients(clients)
+            repo.save_accounts(bank)
+            elapsed = time.perf_counter() - start
+            rows = accounts * (transactions + 2)
+            print(f"Wrote {rows:,} rows in {elapsed:.2f}s")
+            print(f"Throughput: {rows / elapsed:,.0f} rows/s")
+
+            start = time.perf_counter()
+            for number in range(1, accounts + 1, 100):
+                repo.load_account("0001", number)
+            elapsed = time.perf_counter() - start
+            print(
+                f"Account lookups: {accounts // 100 / elapsed:,.0f} "
+                "accounts/s"
+            )
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,145 @@
+import re
+import time
+
+CPF_PATTERN = re.compile(r"[0-9]{11}")
+BIRTH_DATE_PATTERN = re.compile(r"(([0-9]{1,2})-([0-9]{1,2})-([0-9]{2,4}))")
+
+CPF_LENGTH = 11
+FIRST_WEIGHTS = range(10, 1, -1)
+SECOND_WEIGHTS = range(11, 1, -1)
+REPEATED_CPFS = frozenset(str(digit) * CPF_LENGTH for digit in range(10))
+
+INVALID_FORMAT = "The CPF must have exactly 11 digits."
+REPEATED_DIGITS = "The CPF cannot have all digits equal."
+INVALID_CHECK_DIGITS = "The CPF check digits do not match."
+
+
+def _weight_table(weight):
+    return bytes(
+        weight * (code - 48) if 48 <= code <= 57 else 0 for code in range(256)
+    )
+
+
+FIRST_TABLES = [_weight_table(weight) for weight in FIRST_WEIGHTS]
+SECOND_TABLES = [_weight_table(weight) for weight in SECOND_WEIGHTS]
+DIGIT_TABLE = _weight_table(1)
+
+
+def check_digit(total):
+    return total * 10 % 11 % 10
+
+
+def cpf_error(cpf):
+    if not CPF_PATTERN.fullmatch(cpf):
+        return INVALID_FORMAT
+    if cpf in REPEATED_CPFS:
+        return REPEATED_DIGITS
+
+    digits = [int(digit) for digit in cpf]
+    first = check_digit(sum(map(int.__mul__, digits, FIRST_WEIGHTS)))
+    second = check_digit(sum(map(int.__mul__, digits, SECOND_WEIGHTS)))
+    if digits[9] != first or digits[10] != second:
+        return INVALID_CHECK_DIGITS
+    return None
+
+
+def is_valid_cpf(cpf):
+    return cpf_error(cpf) is None
+
+
+def cpf_errors(cpfs):
+    cpfs = list(cpfs)
+    errors = [None] * len(cpfs)
+
+    if _all_well_formed(cpfs):
+        well_formed = cpfs
+        positions = range(len(cpfs))
+    else:
+        well_formed = []
+        positions = []
+        fullmatch = CPF_PATTERN.fullmatch
+        for position, cpf in enumerate(cpfs):
+            if not fullmatch(cpf):
+                errors[position] = INVALID_FORMAT
+            elif cpf in REPEATED_CPFS:
+                errors[position] = REPEATED_DIGITS
+            else:
+                well_formed.append(cpf)
+                positions.append(position)
+
+    if not well_formed:
+        return errors
+
+    matrix = "".join(well_formed).encode("ascii")
+    first_columns = [
+        matrix[column::CPF_LENGTH].translate(table)
+        for column, table in enumerate(FIRST_TABLES)
+    ]
+    second_columns = [
+        matrix[column::CPF_LENGTH].translate(table)
+        for column, table in enumerate(SECOND_TABLES)
+    ]
+    first_digits = matrix[9::CPF_LENGTH].translate(DIGIT_TABLE)
+    second_digits = matrix[10::CPF_LENGTH].translate(DIGIT_TABLE)
+
+    for position, first, second, first_digit, second_digit in zip(
+        positions,
+        map(sum, zip(*first_columns)),
+        map(sum, zip(*second_columns)),
+        first_digits,
+        second_digits,
+    ):
+        if (
+            check_digit(first) != first_digit
+            or check_digit(second) != second_digit
+        ):
+            errors[position] = INVALID_CHECK_DIGITS
+
+    return errors
+
+
+def _all_well_formed(cpfs):
+    if not cpfs or set(map(len, cpfs)) != {CPF_LENGTH}:
+        return False
+    joined = "".join(cpfs)
+    return (
+        joined.isascii()
+        and joined.isdigit()
+        and REPEATED_CPFS.isdisjoint(cpfs)
+    )
+
+
+def validate_cpfs(cpfs):
+    return [error is None for error in cpf_errors(cpfs)]
+
+
+def birth_date_error(birth_date):
+    if not BIRTH_DATE_PATTERN.fullmatch(birth_date):
+        return "Invalid Birth Date."
+    return None
+
+
+def generate_cpf(rng=None):
+    import random
+
+    randrange = (rng or random).randrange
+    digits = [randrange(10) for _ in range(9)]
+    digits.append(check_digit(sum(map(int.__mul__, digits, FIRST_WEIGHTS))))
+    digits.append(check_digit(sum(map(int.__mul__, digits, SECOND_WEIGHTS))))
+    return "".join(map(str, digits))
+
+
+def benchmark(count=1_000_000):
+    cpfs = [generate_cpf() for _ in range(count)]
+
+    start = time.perf_counter()
+    results = validate_cpfs(cpfs)
+    elapsed = time.perf_counter() - start
+
+    print(f"Validated {count:,} CPFs in {elapsed:.3f}s")
+    print(f"Throughput: {count / elapsed:,.0f} CPFs/s")
+    print(f"Valid: {sum(results):,}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -1,207 +1,15 @@
 import os
 import time
-import re
-from abc import ABC, abstractmethod
 from datetime import datetime
 
-
-class Client:
-    def __init__(self, address):
-        self.address = address
-        self.accounts = []
-
-    def perform_transaction(self, account, transaction):
-        if account.history.day_transactions() < 10:
-            transaction.record(account)
-        else:
-            print(
-                "\nOperation failed! "
-                "Maximum number of transactions on a day exceeded."
-            )
-
-    def add_account(self, account):
-        self.accounts.append(account)
-
-
-class Individual(Client):
-    def __init__(self, name, birth_date, cpf, address):
-        super().__init__(address)
-        self.name = name
-        self.birth_date = birth_date
-        self.cpf = cpf
-
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}:{self.cpf}>"
-
-
-class Account:
-    def __init__(self, number, client):
-        self._balance = 0
-        self._number = number
-        self._branch = "0001"
-        self._client = client
-        self._history = History()
-
-    @classmethod
-    def new_account(cls, client, number):
-        return cls(number, client)
-
-    @property
-    def balance(self):
-        return self._balance
-
-    @property
-    def number(self):
-        return self._number
-
-    @property
-    def branch(self):
-        return self._branch
-
-    @property
-    def client(self):
-        return self._client
-
-    @property
-    def history(self):
-        return self._history
-
-    def withdraw(self, amount):
-        balance = self.balance
-        exceeded_balance = amount > balance
-
-        if exceeded_balance:
-            print("\nOperation failed! You do not have enough balance. ")
-
-        elif amount > 0:
-            self._balance -= amount
-            print("\nWithdrawal successful!")
-            return True
-
-        else:
-            print("\nOperation failed! The amount entered is invalid. ")
-
-        return False
-
-    def deposit(self, amount):
-        if amount > 0:
-            self._balance += amount
-            print("\n======== Deposit successful! =========")
-        else:
-            print("\nOperation failed! The amount entered is invalid. ")
-            return False
-
-        return True
-
-
-class CheckingAccount(Account):
-    def __init__(self, number, client, limit=500, withdrawal_limit=3):
-        super().__init__(number, client)
-        self._limit = limit
-        self._withdrawal_limit = withdrawal_limit
-
-    def withdraw(self, amount):
-        number_of_withdrawals = len(
-            [
-                transaction
-                for transaction in self.history.transactions
-                if transaction["type"] == Withdrawal.__name__
-            ]
-        )
-
-        exceeded_limit = amount > self._limit
-        exceeded_withdrawals = number_of_withdrawals >= self._withdrawal_limit
-
-        if exceeded_limit:
-            print(
-                "\nOperation failed! The withdrawal amount exceeds the limit."
-            )
-
-        elif exceeded_withdrawals:
-            print(
-                "\nOperation failed! Maximum number of withdrawals exceeded."
-            )
-
-        else:
-            return super().withdraw(amount)
-
-        return False
-
-    def __repr__(self) -> str:
-        return f"""<{self.__class__.__name__}: ('{self.branch}',
-        '{self.number}', '{self.client.name}>'"""
-
-    def __str__(self):
-        return f"""
-Agency: {self.branch}
-Account: {self.number}
-Owner: {self.client.name}
-"""
-
-
-class History:
-    def __init__(self):
-        self._transactions = []
-
-    @property
-    def transactions(self):
-        return self._transactions
-
-    def add_transaction(self, transaction):
-        self._transactions.append(
-            {
-                "type": transaction.__class__.__name__,
-                "amount": transaction.amount,
-                "date": datetime.now().strftime("%d-%m-%Y %H:%M:%S"),
-            }
-        )
-
-    def day_transactions(self):
-        today = datetime.now().strftime("%d-%m-%Y")
-        return len(
-            [
-                transaction
-                for transaction in self._transactions
-                if today[0] in transaction["date"]
-            ]
-        )
-
-
-class Transaction(ABC):
-    @property
-    @abstractmethod
-    def amount(self):
-        pass
-
-    @abstractmethod
-    def record(self, account):
-        pass
-
-
-class Withdrawal(Transaction):
-    def __init__(self, amount):
-        self._amount = amount
-
-    @property
-    def amount(self):
-        return self._amount
-
-    def record(self, account):
-        if account.withdraw(self.amount):
-            account.history.add_transaction(self)
-
-
-class Deposit(Transaction):
-    def __init__(self, amount):
-        self._amount = amount
-
-    @property
-    def amount(self):
-        return self._amount
-
-    def record(self, account):
-        if account.deposit(self.amount):
-            account.history.add_transaction(self)
+from banking.core import (
+    CheckingAccount,
+    Deposit,
+    Individual,
+    PrefixView,
+    Withdrawal,
+)
+from banking.validation import birth_date_error, cpf_error
 
 
 def log_transaction(func):
@@ -280,27 +88,24 @@ def show_extract(clients):
     if not account:
         return
 
+    history, balance = account.snapshot()
     print()
     print(" Extract ".center(50, "="))
-    transactions = account.history.transactions
-
-    extract = ""
-    if not transactions:
+    extract = "".join(
+        f"\n{transaction['type']}:\t$ {transaction['amount']:.2f}\t"
+        + f"Date:\t{transaction['date']}"
+        for transaction in history
+    )
+    if not extract:
         extract = "No transactions have been made."
-    else:
-        for transaction in transactions:
-            extract += (
-                f"\n{transaction['type']}:\t$ {transaction['amount']:.2f}\t"
-                + f"Date:\t{transaction['date']}"
-            )
 
     print(extract)
-    print(f"\nBalance:\t$ {account.balance:.2f}")
+    print(f"\nBalance:\t$ {balance:.2f}")
     print("==================================================")
 
 
 @log_transaction
-def create_client(clients):
+def create_client(clients, index=None):
     cpf = input("Enter the cpf (numbers only): ")
     if not valid_cpf(cpf):
         return
@@ -312,8 +117,8 @@ def create_client(clients):
 
     name = input("Enter the full name: ")
     birth_date = input("Enter the birth date (dd-mm-yyyy): ")
-    if not re.fullmatch(r"((\d{1,2})-(\d{1,2})-(\d{2,4}))", birth_date):
-        print("\nInvalid Birth Date.")
+    if error := birth_date_error(birth_date):
+        print(f"\n{error}")
         return
     address = input(
         "Enter the address (street, number - neighborhood - city/state): "
@@ -323,11 +128,13 @@ def create_client(clients):
         name=name, birth_date=birth_date, cpf=cpf, address=address
     )
     clients.append(client)
+    if index is not None:
+        index.add(client)
     print("\nClient created successfully!")
 
 
 @log_transaction
-def create_account(account_number, clients, accounts):
+def create_account(sequence, clients, accounts):
     cpf = input("Enter the client's cpf: ")
     if not valid_cpf(cpf):
         return
@@ -337,7 +144,12 @@ def create_account(account_number, clients, accounts):
         print("\nClient not found, account creation process ended! ")
         return
 
-    account = CheckingAccount.new_account(client=client, number=account_number)
+    taken = {(account.branch, account.number) for account in accounts}
+    number = sequence()
+    while (sequence.branch, number) in taken:
+        number = sequence()
+
+    account = CheckingAccount.new_account(client=client, number=number)
     accounts.append(account)
     client.accounts.append(account)
 
@@ -345,14 +157,63 @@ def create_account(account_number, clients, accounts):
 
 
 @log_transaction
-def list_accounts(accounts):
-    output = "\n".join("=" * 50 + "\n" + str(account) for account in accounts)
-    print(output)
+def list_accounts(accounts, page_size=20):
+    from functools import partial
+
+    from banking.listing import iter_pages, page
+
+    for current in iter_pages(partial(page, PrefixView(accounts)), page_size):
+        print(current)
+        if current.cursor is None:
+            break
+        if input("\n[Enter] next page, [q] stop: ").strip().lower() == "q":
+            break
+
+
+@log_transaction
+def import_clients(clients, accounts, index=None, sequence=None):
+    from banking.importer import import_csv
+
+    path = input("Enter the CSV file path: ")
+    try:
+        report = import_csv(
+            path, clients, accounts, rejects_path=f"{path}.rejected.csv"
+        )
+    except (OSError, ValueError) as error:
+        print(f"\nImport failed! {error}")
+        return
+
+    if index is not None:
+        index.extend(clients[len(index) :])
+    if sequence is not None and report.accounts:
+        sequence.advance_past(
+            max(
+                account.number
+                for account in accounts
+                if account.branch == sequence.branch
+            )
+        )
+    print(f"\n{report}")
+    if report.rejected:
+        print(f"Rejected rows written to {path}.rejected.csv")
+
+
+@log_transaction
+def search_clients(index):
+    query = input("Enter the client's name: ")
+    results = index.search(query)
+    if not results:
+        print("\nNo clients found!")
+        return
+
+    print()
+    for client in results:
+        print(f"{client.name}\tCPF: {client.cpf}")
 
 
 def valid_cpf(cpf):
-    if not re.fullmatch(r"\d{11}", cpf):
-        print("\nInvalid CPF!")
+    if error := cpf_error(cpf):
+        print(f"\nInvalid CPF! {error}")
         return
     return True
 
@@ -392,6 +253,8 @@ def menu():
         "[3]\tNew Client\n"
         "[4]\tNew Account\n"
         "[5]\tList Accounts\n"
+        "[6]\tImport CSV\n"
+        "[7]\tSearch Clients\n"
         "[q]\tQuit\n"
         "=> "
     )
@@ -399,8 +262,14 @@ def menu():
 
 
 def main():
+    from banking.search import ClientIndex
+    from banking.sequences import SequenceAllocator
+
     clients = []
     accounts = []
+    index = ClientIndex()
+    allocator = SequenceAllocator("Desafio 5 Log/sequences.db", block_size=1)
+    sequence = allocator.sequence()
 
     while True:
         os.system("clear")
@@ -416,11 +285,10 @@ def main():
             show_extract(clients)
 
         elif option == "3":
-            create_client(clients)
+            create_client(clients, index)
 
         elif option == "4":
-            account_number = len(accounts) + 1
-            create_account(account_number, clients, accounts)
+            create_account(sequence, clients, accounts)
 
         elif option == "5":
             if accounts:
@@ -428,7 +296,14 @@ def main():
             else:
                 print("\nNo accounts to show!")
 
+        elif option == "6":
+            import_clients(clients, accounts, index, sequence)
+
+        elif option == "7":
+            search_clients(index)
+
         elif option == "q":
+            allocator.close()
             break
 
         else:
@@ -439,4 +314,5 @@ def main():
         time.sleep(5)
 
 
-main()
+if __name__ == "__main__":
+    main()
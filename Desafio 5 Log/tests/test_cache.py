@@ -0,0 +1,57 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from banking.cache import AccountCache
+from banking.core import CheckingAccount, Deposit, Individual
+from banking.storage import SQLiteRepository
+
+
+class AccountCacheTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.repository = SQLiteRepository(
+            os.path.join(directory.name, "bank.db")
+        )
+        self.addCleanup(self.repository.close)
+
+        client = Individual("Ana", "01-01-1990", "52998224725", "Street")
+        accounts = []
+        for number in (1, 2, 3):
+            account = CheckingAccount.new_account(client, number)
+            account._balance = 100
+            client.add_account(account)
+            accounts.append(account)
+        self.repository.save_clients([client])
+        self.repository.save_accounts(accounts)
+        self.cache = AccountCache(self.repository, max_accounts=1)
+
+    def test_evicted_account_still_in_use_is_not_reloaded(self):
+        held = self.cache.get("0001", 1)
+        self.cache.get("0001", 2)
+        with redirect_stdout(io.StringIO()):
+            held.client.perform_transaction(held, Deposit(50))
+
+        self.assertIs(self.cache.get("0001", 1), held)
+        self.cache.flush()
+        self.assertEqual(self.repository.load_account("0001", 1).balance, 150)
+
+    def test_accounts_of_one_client_share_the_client(self):
+        first = self.cache.get("0001", 1)
+        second = self.cache.get("0001", 2)
+        self.assertIs(first.client, second.client)
+
+    def test_checked_out_account_is_not_evicted(self):
+        with self.cache.checkout("0001", 3) as account:
+            self.cache.get("0001", 1)
+            self.cache.get("0001", 2)
+            self.assertIn(("0001", 3), self.cache)
+            self.assertIs(self.cache.get("0001", 3), account)
+        self.assertEqual(len(self.cache), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import io
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+from banking.batch import AtomicBatch
+from banking.core import Account, CheckingAccount, Deposit, Fee, Individual
+from banking.reconciliation import Reconciliation
+
+
+class FeeCapTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Individual("Ana", "01-01-1990", "52998224725", "Street")
+        self.account = CheckingAccount.new_account(self.client, 1)
+        self.client.add_account(self.account)
+        with redirect_stdout(io.StringIO()):
+            for _ in range(Account.daily_transaction_limit):
+                self.client.perform_transaction(self.account, Deposit(10))
+
+    def test_fee_at_the_cap_is_charged(self):
+        with redirect_stdout(io.StringIO()):
+            self.client.perform_transaction(self.account, Fee(1.5))
+        self.assertEqual(self.account.balance, 98.5)
+
+    def test_batch_fee_at_the_cap_is_accepted(self):
+        batch = AtomicBatch()
+        batch.charge(self.account, 1.5)
+        with redirect_stdout(io.StringIO()):
+            batch.commit()
+        self.assertEqual(self.account.balance, 98.5)
+
+    def test_fee_does_not_count_toward_reconciled_cap(self):
+        with redirect_stdout(io.StringIO()):
+            Fee(1.5).record(self.account)
+        with ThreadPoolExecutor(1) as executor:
+            report = Reconciliation().run([self.account], executor)
+        self.assertTrue(report.balanced, report.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import threading
+import unittest
+
+from banking.idempotency import DedupeTable
+
+
+class DedupeTableTest(unittest.TestCase):
+    def test_replay_returns_first_result(self):
+        table = DedupeTable()
+        self.assertEqual(table.run("key", lambda: 1), 1)
+        self.assertEqual(table.run("key", lambda: 2), 1)
+        self.assertEqual(table.hits, 1)
+
+    def test_waiter_retries_after_first_attempt_fails(self):
+        table = DedupeTable()
+        started = threading.Event()
+        waiting = threading.Event()
+        release = threading.Event()
+        results = []
+
+        wait = table._done.wait
+
+        def signal_wait(*args):
+            waiting.set()
+            return wait(*args)
+
+        table._done.wait = signal_wait
+
+        def failing():
+            started.set()
+            release.wait()
+            raise RuntimeError("declined")
+
+        def first():
+            with self.assertRaises(RuntimeError):
+                table.run("key", failing)
+
+        owner = threading.Thread(target=first)
+        owner.start()
+        started.wait()
+        waiter = threading.Thread(
+            target=lambda: results.append(table.run("key", lambda: "done"))
+        )
+        waiter.start()
+        waiting.wait()
+        release.set()
+        owner.join()
+        waiter.join()
+
+        self.assertEqual(results, ["done"])
+        self.assertEqual(table.run("key", lambda: "again"), "done")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from banking.importer import FIELDS, import_csv
+
+
+class ImportCsvTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def write(self, rows):
+        path = os.path.join(self.directory.name, "clients.csv")
+        with open(path, "w", newline="", encoding="UTF-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(FIELDS)
+            writer.writerows(rows)
+        return path
+
+    def test_non_ascii_cpf_rejects_only_its_row(self):
+        path = self.write(
+            [
+                ("52998224725", "Ana", "01-01-1990", "Street", "1"),
+                ("١" * 9 + "23", "Bia", "01-01-1990", "Street", "2"),
+            ]
+        )
+        clients, accounts = [], []
+        report = import_csv(path, clients, accounts)
+
+        self.assertEqual(report.rows, 2)
+        self.assertEqual([client.name for client in clients], ["Ana"])
+        self.assertEqual([account.number for account in accounts], [1])
+        self.assertEqual(len(report.rejected), 1)
+        line, _, reason = report.rejected[0]
+        self.assertEqual(line, 3)
+        self.assertTrue(reason.startswith("Invalid CPF."))
+
+    def test_duplicate_account_does_not_create_its_client(self):
+        path = self.write(
+            [
+                ("52998224725", "Ana", "01-01-1990", "Street", "1"),
+                ("11144477735", "Bia", "01-01-1990", "Street", "1"),
+            ]
+        )
+        clients, accounts = [], []
+        report = import_csv(path, clients, accounts)
+
+        self.assertEqual([client.name for client in clients], ["Ana"])
+        self.assertEqual(report.clients, 1)
+        self.assertEqual(report.accounts, 1)
+        self.assertEqual(
+            [reason for _, _, reason in report.rejected],
+            ["Duplicate account number."],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
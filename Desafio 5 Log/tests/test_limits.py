@@ -0,0 +1,27 @@
+import unittest
+from datetime import datetime, timedelta
+
+from banking.limits import FixedDayWindow, RollingWindow
+
+
+class ZeroCountWindowTest(unittest.TestCase):
+    def test_rolling_window_with_zero_count_refuses(self):
+        rule = RollingWindow(0, "Not allowed.")
+        self.assertFalse(rule.allows(10, datetime.now()))
+
+    def test_rolling_window_matches_fixed_day_window(self):
+        now = datetime(2026, 1, 1, 12)
+        for max_count in (0, 1, 2):
+            rolling = RollingWindow(max_count, "Limit.")
+            fixed = FixedDayWindow(max_count, "Limit.")
+            for step in range(3):
+                moment = now + timedelta(seconds=step)
+                self.assertEqual(
+                    rolling.allows(10, moment), fixed.allows(10, moment)
+                )
+                rolling.record(10, moment)
+                fixed.record(10, moment)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from banking import core
+from banking.batch import AtomicBatch
+from banking.core import CheckingAccount, Deposit, Individual
+
+
+def failing_listener(account, entry):
+    raise RuntimeError("listener is down")
+
+
+class ListenerIsolationTest(unittest.TestCase):
+    def setUp(self):
+        client = Individual("Ana", "01-01-1990", "52998224725", "Street")
+        self.account = CheckingAccount.new_account(client, 1)
+        self.seen = []
+        core.transaction_listeners[:0] = [
+            failing_listener,
+            lambda account, entry: self.seen.append(entry),
+        ]
+        self.addCleanup(core.transaction_listeners.__delitem__, slice(0, 2))
+        core.listener_errors.clear()
+
+    def test_commit_notifies_remaining_listeners(self):
+        with redirect_stdout(io.StringIO()):
+            self.assertTrue(Deposit(50).record(self.account))
+        self.assertEqual(len(self.seen), 1)
+        self.assertEqual(core.listener_errors["failing_listener"], 1)
+
+    def test_batch_notifies_remaining_listeners(self):
+        batch = AtomicBatch()
+        batch.deposit(self.account, 50)
+        batch.deposit(self.account, 25)
+        with redirect_stdout(io.StringIO()):
+            batch.commit()
+        self.assertEqual(self.account.balance, 75)
+        self.assertEqual(len(self.seen), 2)
+        self.assertEqual(core.listener_errors["failing_listener"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import io
+import os
+import unittest
+from contextlib import redirect_stdout
+from multiprocessing import Pipe, Process
+
+from banking.core import CheckingAccount, Deposit, Individual
+from banking.shared_balances import BalanceTable, SharedBalances
+
+
+def _read_balances(name, numbers, connection):
+    table = BalanceTable.attach(name)
+    try:
+        connection.send([table.balance_of(number) for number in numbers])
+    finally:
+        table.close()
+
+
+class SharedBalancesTest(unittest.TestCase):
+    def setUp(self):
+        self.balances = SharedBalances(f"test-balances-{os.getpid()}", 16)
+        self.balances.attach()
+        self.addCleanup(self.balances.close)
+        self.addCleanup(self.balances.detach)
+        self.client = Individual(
+            "Ana", "01-01-1990", "52998224725", "Street"
+        )
+
+    def deposit(self, number, amount):
+        account = CheckingAccount.new_account(self.client, number)
+        with redirect_stdout(io.StringIO()):
+            self.client.perform_transaction(account, Deposit(amount))
+        return account
+
+    def test_reader_resolves_accounts_by_number_in_another_process(self):
+        for number, amount in ((1000, 10), (7, 20), (3, 30)):
+            self.deposit(number, amount)
+
+        receiver, sender = Pipe(duplex=False)
+        reader = Process(
+            target=_read_balances,
+            args=(
+                self.balances.table_name("0001"),
+                (3, 1000, 7),
+                sender,
+            ),
+        )
+        reader.start()
+        balances = receiver.recv()
+        reader.join()
+
+        self.assertEqual(balances, [30.0, 10.0, 20.0])
+
+    def test_unknown_account_raises_key_error(self):
+        self.deposit(5, 1)
+        table = BalanceTable.attach(self.balances.table_name("0001"))
+        self.addCleanup(table.close)
+        self.assertEqual(table.balance_of(5), 1.0)
+        with self.assertRaises(KeyError):
+            table.balance_of(6)
+
+    def test_full_table_does_not_break_commit(self):
+        for number in range(1, 17):
+            self.deposit(number, 1)
+        account = self.deposit(17, 5)
+
+        self.assertEqual(account.balance, 5)
+        self.assertEqual(self.balances.unpublished, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from banking.core import (
+    Account,
+    CheckingAccount,
+    Deposit,
+    Individual,
+    Withdrawal,
+)
+from banking.snapshot import Snapshot, dumps, loads
+
+
+class SnapshotRestoreTest(unittest.TestCase):
+    def setUp(self):
+        self.client = Individual("Ana", "01-01-1990", "52998224725", "Street")
+
+    def round_trip(self, accounts):
+        return loads(*dumps(Snapshot.from_accounts(accounts))).restore()
+
+    def test_account_kind_is_kept(self):
+        savings = Account.new_account(self.client, 1)
+        checking = CheckingAccount.new_account(self.client, 2)
+        restored = self.round_trip([savings, checking])
+        self.assertEqual(
+            [type(account) for account in restored], [Account, CheckingAccount]
+        )
+
+    def test_todays_limits_are_replayed(self):
+        account = CheckingAccount(1, self.client, withdrawal_limit=1)
+        with redirect_stdout(io.StringIO()):
+            Deposit(100).record(account)
+            Withdrawal(10).record(account)
+
+        (restored,) = self.round_trip([account])
+        self.assertIsNotNone(restored.limits.check(Withdrawal.__name__, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
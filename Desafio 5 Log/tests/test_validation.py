@@ -0,0 +1,68 @@
+import unittest
+from random import Random
+
+from banking.validation import (
+    INVALID_CHECK_DIGITS,
+    INVALID_FORMAT,
+    REPEATED_DIGITS,
+    cpf_error,
+    cpf_errors,
+    generate_cpf,
+)
+
+ARABIC_INDIC_ONES = "١" * 11
+
+
+class CpfErrorTest(unittest.TestCase):
+    def test_valid_cpf(self):
+        self.assertIsNone(cpf_error("52998224725"))
+
+    def test_wrong_check_digits(self):
+        self.assertEqual(cpf_error("52998224726"), INVALID_CHECK_DIGITS)
+
+    def test_repeated_digits(self):
+        self.assertEqual(cpf_error("11111111111"), REPEATED_DIGITS)
+
+    def test_rejects_non_ascii_digits(self):
+        self.assertEqual(cpf_error(ARABIC_INDIC_ONES), INVALID_FORMAT)
+        self.assertEqual(
+            cpf_error("١" * 9 + "23"), INVALID_FORMAT
+        )
+
+
+class CpfErrorsTest(unittest.TestCase):
+    def test_rejects_non_ascii_row_without_failing_the_batch(self):
+        cpfs = ["52998224725", "١" * 9 + "23", "52998224726"]
+        self.assertEqual(
+            cpf_errors(cpfs), [None, INVALID_FORMAT, INVALID_CHECK_DIGITS]
+        )
+
+    def test_matches_scalar_validation(self):
+        rng = Random(7)
+        cpfs = [generate_cpf(rng) for _ in range(200)]
+        cpfs += [
+            cpf[:10] + str((int(cpf[10]) + 1) % 10) for cpf in cpfs[:50]
+        ]
+        cpfs += [
+            "00000000000",
+            "1234567890",
+            "123456789012",
+            "5299822472a",
+            "",
+            ARABIC_INDIC_ONES,
+            "５" * 11,
+        ]
+        rng.shuffle(cpfs)
+        self.assertEqual(cpf_errors(cpfs), [cpf_error(cpf) for cpf in cpfs])
+
+    def test_all_well_formed_fast_path(self):
+        rng = Random(11)
+        cpfs = [generate_cpf(rng) for _ in range(100)]
+        self.assertEqual(cpf_errors(cpfs), [cpf_error(cpf) for cpf in cpfs])
+
+    def test_empty(self):
+        self.assertEqual(cpf_errors([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()